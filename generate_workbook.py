@@ -5,16 +5,28 @@ Creates a comprehensive bookkeeping and accounting workbook with interconnected
 """
 
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
-from openpyxl.chart import LineChart, BarChart, Reference
-from openpyxl.chart.label import DataLabelList
-from openpyxl.formatting.rule import CellIsRule, ColorScaleRule
-from openpyxl.styles.differential import DifferentialStyle
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, Color, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.utils import get_column_letter, quote_sheetname
+from openpyxl.chart import LineChart, Reference
+from openpyxl.formatting.rule import CellIsRule
+from openpyxl.workbook.defined_name import DefinedName
 from openpyxl.worksheet.datavalidation import DataValidation
+from openpyxl.worksheet.formula import ArrayFormula
+from openpyxl.worksheet.table import Table
+from openpyxl.worksheet.dimensions import ColumnDimension
 from openpyxl.drawing.image import Image
+from openpyxl.writer.excel import ExcelWriter
 from datetime import datetime
+import argparse
+import calendar
+import functools
+import hashlib
+import io
 import os
+import re
+import shutil
+import zipfile
 
 # ============================================================================
 # COMPANY BRANDING CONFIGURATION
@@ -41,27 +53,270 @@ BRAND_COLOR_PRIMARY = "203864"  # Dark blue
 BRAND_COLOR_SECONDARY = "366092"  # Medium blue
 BRAND_COLOR_ACCENT = "4472C4"  # Light blue
 
+# VAT rate (%) written to the Settings sheet
+VAT_RATE_PERCENT = 15
+
+# Opening balances written to the Settings sheet
+OPENING_CASH = 5000
+OPENING_BANK = 50000
+
+# Header lines built once from the details above (no need to edit)
+CONTACT_LINE = f"{COMPANY_PHONE} | {COMPANY_EMAIL}"
+ADDRESS_LINE = f"{COMPANY_ADDRESS} | {COMPANY_WEBSITE}"
+
+# ============================================================================
+# BOOKKEEPING LISTS
 # ============================================================================
+# Shared by the Settings sheet (drop-down sources) and the per-category reports
+
+EXPENSE_CATEGORIES = (
+    "Equipment Purchase",
+    "Equipment Maintenance",
+    "Transport/Fuel",
+    "Salaries/Wages",
+    "Rent",
+    "Utilities",
+    "Insurance",
+    "Marketing",
+    "Office Supplies",
+    "Professional Fees",
+    "Bank Charges",
+    "Other",
+)
+
+# Reported as Cost of Services on the P&L; the rest are operating expenses
+COST_OF_SERVICES_CATEGORY = "Equipment Purchase"
+OPERATING_EXPENSE_CATEGORIES = tuple(
+    cat for cat in EXPENSE_CATEGORIES if cat != COST_OF_SERVICES_CATEGORY
+)
+
+PAYMENT_METHODS = ("Cash", "Bank Transfer", "Cheque", "Mobile Money", "Card")
+
+# Sample stock: (Stock ID, description, unit price, in store, rented out, in transit)
+INVENTORY_ITEMS = (
+    ("STK-001", "LED Par Light", 2500, 20, 5, 0),
+    ("STK-002", "Moving Head Light", 8000, 10, 3, 2),
+    ("STK-003", "Sound System (Complete)", 45000, 3, 1, 0),
+    ("STK-004", "Smoke Machine", 3500, 8, 2, 0),
+    ("STK-005", "DMX Controller", 5000, 5, 1, 0),
+    ("STK-006", "Lighting Truss (per meter)", 800, 50, 20, 0),
+    ("STK-007", "Power Distribution Box", 1200, 15, 5, 0),
+    ("STK-008", "Microphone (Wireless)", 1500, 12, 4, 0),
+    ("STK-009", "Speaker (500W)", 6000, 8, 3, 1),
+    ("STK-010", "Cable Set (Complete)", 300, 30, 10, 5),
+)
+# Inventory row holding the total stock value, below the header and items
+STOCK_TOTAL_ROW = len(INVENTORY_ITEMS) + 2
+
+# Last row the data-entry sheets (Invoices, Expenses, ...) are sized for.
+# Validations and summary formulas stop here instead of scanning whole columns
+MAX_DATA_ROW = 1000
+
+# Excel Tables over the Revenue and Expenses entry rows. Formulas refer to
+# their columns by name (e.g. RevenueTbl[Date]) and Excel grows the tables
+# as rows are added, so those sums never scan empty cells
+REVENUE_TABLE = "RevenueTbl"
+EXPENSES_TABLE = "ExpensesTbl"
+
+# Money received / spent in one month of the current year; fill with the
+# cells holding the month's first day and the next month's first day
+MONTHLY_INFLOW_FORMULA = (
+    f'=SUMIFS({REVENUE_TABLE}[Amount Received],{REVENUE_TABLE}[Date],">="&%s,'
+    f'{REVENUE_TABLE}[Date],"<"&%s)'
+)
+MONTHLY_OUTFLOW_FORMULA = (
+    f'=SUMIFS({EXPENSES_TABLE}[Amount],{EXPENSES_TABLE}[Date],">="&%s,'
+    f'{EXPENSES_TABLE}[Date],"<"&%s)'
+)
+# Hidden columns H:I of the Cash Position month rows hold those boundaries,
+# so each is computed once rather than in every SUMIFS that uses it
+FIRST_MONTH_ROW = 6
+MONTH_BOUNDS = [
+    (f"$H${row}", f"$I${row}")
+    for row in range(FIRST_MONTH_ROW, FIRST_MONTH_ROW + 12)
+]
+# (inflow, outflow) formulas for months 1-12 of Cash Position; the Dashboard
+# trend table links to those cells rather than summing again
+MONTHLY_FLOW_FORMULAS = [
+    (MONTHLY_INFLOW_FORMULA % bounds, MONTHLY_OUTFLOW_FORMULA % bounds)
+    for bounds in MONTH_BOUNDS
+]
+
+# Expenses by category, filled with the category cell or a quoted name
+CATEGORY_MONTH_FORMULA = (
+    f'=SUMIFS({EXPENSES_TABLE}[Amount],{EXPENSES_TABLE}[Expense Category],%s,'
+    f'{EXPENSES_TABLE}[Date],">="&DATE(YEAR(ReportDate),MONTH(ReportDate),1))'
+)
+CATEGORY_YTD_FORMULA = (
+    f'=SUMIFS({EXPENSES_TABLE}[Amount],{EXPENSES_TABLE}[Expense Category],%s,'
+    f'{EXPENSES_TABLE}[Date],">="&FYStart)'
+)
+CATEGORY_FY_FORMULA = (
+    f'=SUMIFS({EXPENSES_TABLE}[Amount],{EXPENSES_TABLE}[Expense Category],%s,'
+    f'{EXPENSES_TABLE}[Date],">="&FYStart,{EXPENSES_TABLE}[Date],"<"&DATE(YEAR(FYStart)+1,1,1))'
+)
+
+# Rows of the totals other sheets read by name (see WORKBOOK_NAMES); the
+# builders lay their sections out around these
+CASH_IN_HAND_ROW = 8  # Cash Position, column B
+CASH_AT_BANK_ROW = 14  # Cash Position, column B
+RECEIVABLES_ROW = 3  # Trade Debtors, column J
+
+# Workbook-level names for the Settings values and the drop-down sources, so
+# each location is defined once and formulas/validations use the name
+WORKBOOK_NAMES = {
+    "VATRate": "Settings!$B$13",
+    "FYStart": "Settings!$B$14",
+    "ReportDate": "Settings!$B$15",
+    "OpeningCash": "Settings!$B$17",
+    "OpeningBank": "Settings!$B$18",
+    "ExpenseCategories": f"Settings!$A$21:$A${20 + len(EXPENSE_CATEGORIES)}",
+    "PaymentMethods": f"Settings!$D$21:$D${20 + len(PAYMENT_METHODS)}",
+    "CustomerList": "Customers!$B$2:$B$100",
+    "VendorList": "Vendors!$B$2:$B$100",
+    # Totals read by the Balance Sheet, Bank Reconciliation and Dashboard
+    "CashInHand": f"'Cash Position'!$B${CASH_IN_HAND_ROW}",
+    "CashAtBank": f"'Cash Position'!$B${CASH_AT_BANK_ROW}",
+    "Receivables": f"'Trade Debtors'!$J${RECEIVABLES_ROW}",
+    "StockValue": f"Inventory!$H${STOCK_TOTAL_ROW}",
+}
+
+# ============================================================================
+# SHARED STYLES
+# ============================================================================
+# openpyxl style objects are immutable, so each one is built once here and
+# reused by every sheet instead of being reconstructed per cell
+
+# Brand colors as opaque ARGB Color objects, so fonts and fills share them
+# instead of each parsing the hex string again
+PRIMARY_COLOR = Color(rgb="FF" + BRAND_COLOR_PRIMARY)
+SECONDARY_COLOR = Color(rgb="FF" + BRAND_COLOR_SECONDARY)
+ACCENT_COLOR = Color(rgb="FF" + BRAND_COLOR_ACCENT)
+
+THIN = Side(style='thin')
+
+HEADER_FONT = Font(bold=True, color="FFFFFFFF", size=11)
+HEADER_FILL = PatternFill(start_color=SECONDARY_COLOR, end_color=SECONDARY_COLOR, fill_type="solid")
+HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center", wrap_text=True)
+HEADER_BORDER = Border(left=THIN, right=THIN, top=THIN, bottom=THIN)
+
+COMPANY_NAME_FONT = Font(bold=True, size=16, color=PRIMARY_COLOR)
+TAGLINE_FONT = Font(size=10, italic=True, color="FF666666")
+CONTACT_FONT = Font(size=9, color="FF666666")
+
+# Sheet banners and section bars
+REPORT_TITLE_FONT = Font(bold=True, size=16, color="FFFFFFFF")
+TITLE_FONT = Font(bold=True, size=14, color="FFFFFFFF")
+TITLE_FILL = PatternFill(start_color=PRIMARY_COLOR, end_color=PRIMARY_COLOR, fill_type="solid")
+LARGE_SECTION_FONT = Font(bold=True, size=13, color="FFFFFFFF")
+SECTION_FONT = Font(bold=True, size=12, color="FFFFFFFF")
+SECTION_FILL = HEADER_FILL
+CENTER_ALIGNMENT = Alignment(horizontal="center")
+MIDDLE_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+RIGHT_ALIGNMENT = Alignment(horizontal="right")
+
+# Labels, notes and totals
+BODY_FONT = Font(size=11)
+BOLD_FONT = Font(bold=True)
+BOLD_ITALIC_FONT = Font(bold=True, italic=True)
+SUMMARY_TITLE_FONT = Font(bold=True, size=12)
+TOTAL_FONT = Font(bold=True, size=13)
+HEADING_FONT = Font(bold=True, size=14)
+NOTE_FONT = Font(italic=True, color="FF666666")
+CAPTION_FONT = Font(italic=True, size=10)
+FOOTNOTE_FONT = Font(italic=True, size=9, color="FF666666")
+TIMESTAMP_FONT = Font(italic=True, size=9)
+
+# Dashboard and invoice headings
+DASHBOARD_TITLE_FONT = Font(bold=True, size=18, color="FFFFFFFF")
+INVOICE_TITLE_FONT = Font(bold=True, size=24, color="FFFFFFFF")
+INVOICE_COMPANY_FONT = Font(bold=True, size=20, color=PRIMARY_COLOR)
+INVOICE_TAGLINE_FONT = Font(size=11, italic=True, color="FF666666")
+TOTAL_FILL = PatternFill(start_color="FFE7E6E6", end_color="FFE7E6E6", fill_type="solid")
+SUBTOTAL_FILL = PatternFill(start_color="FFD9E1F2", end_color="FFD9E1F2", fill_type="solid")
+HIGHLIGHT_FILL = PatternFill(start_color="FFFFF2CC", end_color="FFFFF2CC", fill_type="solid")
+PROFIT_FILL = PatternFill(start_color="FF92D050", end_color="FF92D050", fill_type="solid")
+STOCK_FILL = PatternFill(start_color="FFE2EFDA", end_color="FFE2EFDA", fill_type="solid")
+TAX_FILL = PatternFill(start_color="FFFFE699", end_color="FFFFE699", fill_type="solid")
+GRAND_TOTAL_FILL = PatternFill(start_color="FFB4C7E7", end_color="FFB4C7E7", fill_type="solid")
+AUDIT_FILL = PatternFill(start_color="FFC00000", end_color="FFC00000", fill_type="solid")
+
+MONEY_FORMAT = '#,##0.00'
+DATE_FORMAT = 'YYYY-MM-DD'
+PERCENT_FORMAT = '0.00%'
+TIMESTAMP_FORMAT = 'YYYY-MM-DD HH:MM:SS'
+
+# Number formats as named styles, applied with cell.style = 'money' etc.
+# Assigning a named style resets the cell's font and fill, so it must come
+# before any other styling of that cell
+NAMED_STYLES = (
+    NamedStyle(name='header', font=HEADER_FONT, fill=HEADER_FILL,
+               alignment=HEADER_ALIGNMENT, border=HEADER_BORDER),
+    NamedStyle(name='money', number_format=MONEY_FORMAT, font=DEFAULT_FONT),
+    NamedStyle(name='money_bold', number_format=MONEY_FORMAT, font=BOLD_FONT),
+    NamedStyle(name='money_total', number_format=MONEY_FORMAT, font=BOLD_FONT, fill=TOTAL_FILL),
+    NamedStyle(name='money_highlight', number_format=MONEY_FORMAT, font=BOLD_FONT, fill=HIGHLIGHT_FILL),
+    NamedStyle(name='ymd', number_format=DATE_FORMAT, font=DEFAULT_FONT),
+    NamedStyle(name='pct', number_format=PERCENT_FORMAT, font=DEFAULT_FONT),
+    # Grey Dashboard KPI cells
+    NamedStyle(name='kpi_money', number_format=MONEY_FORMAT, font=DEFAULT_FONT, fill=TOTAL_FILL),
+    NamedStyle(name='kpi_pct', number_format=PERCENT_FORMAT, font=DEFAULT_FONT, fill=TOTAL_FILL),
+    NamedStyle(name='kpi_ratio', number_format='0.00', font=DEFAULT_FONT, fill=TOTAL_FILL),
+    NamedStyle(name='kpi_days', number_format='0.0 "days"', font=DEFAULT_FONT, fill=TOTAL_FILL),
+)
+
+# Conditional formatting highlights
+GOOD_FILL = PatternFill(start_color="FFC6EFCE", end_color="FFC6EFCE", fill_type="solid")
+BAD_FILL = PatternFill(start_color="FFFFC7CE", end_color="FFFFC7CE", fill_type="solid")
+
+# Column letters indexed by column number - 1
+COL_LETTERS = tuple(get_column_letter(i) for i in range(1, 257))
+
+# ============================================================================
+
+@functools.lru_cache(maxsize=None)
+def load_logo_bytes(logo_path):
+    """Decode and shrink the logo once, returning PNG bytes shared by every sheet"""
+    # Every failure returns None rather than raising, so it is cached too and
+    # later sheets neither re-read the file nor repeat the warning
+    try:
+        from PIL import Image as PILImage
+        
+        with PILImage.open(logo_path) as logo:
+            logo.thumbnail((LOGO_WIDTH, LOGO_HEIGHT))
+            # PNG cannot store e.g. CMYK JPEGs
+            if logo.mode not in ('1', 'L', 'LA', 'P', 'RGB', 'RGBA'):
+                logo = logo.convert('RGBA')
+            buffer = io.BytesIO()
+            logo.save(buffer, format='PNG')
+    except FileNotFoundError:
+        return None
+    except (ImportError, OSError) as e:
+        # Pillow missing, or a logo that cannot be opened or decoded
+        # (PIL.UnidentifiedImageError is an OSError)
+        print(f"⚠️  Could not add logo: {e}")
+        return None
+    return buffer.getvalue()
 
 def add_logo_to_sheet(ws, cell_position='A1', logo_path=None):
     """Add company logo to a worksheet if logo file exists"""
     if logo_path is None:
         logo_path = LOGO_FILENAME
     
-    # Check if logo file exists
-    if os.path.exists(logo_path):
-        try:
-            img = Image(logo_path)
-            # Resize logo
-            img.width = LOGO_WIDTH
-            img.height = LOGO_HEIGHT
-            # Add to worksheet
-            ws.add_image(img, cell_position)
-            return True
-        except Exception as e:
-            print(f"⚠️  Could not add logo: {e}")
+    try:
+        logo_bytes = load_logo_bytes(logo_path)
+        if logo_bytes is None:
             return False
-    return False
+        img = Image(io.BytesIO(logo_bytes))
+        # Resize logo
+        img.width = LOGO_WIDTH
+        img.height = LOGO_HEIGHT
+        # Add to worksheet
+        ws.add_image(img, cell_position)
+        return True
+    except Exception as e:
+        print(f"⚠️  Could not add logo: {e}")
+        return False
 
 def add_company_header(ws, start_row=1, include_logo=True):
     """Add standardized company header to sheets"""
@@ -75,197 +330,236 @@ def add_company_header(ws, start_row=1, include_logo=True):
     
     # Company Name
     ws[f'{text_col}{start_row}'] = COMPANY_NAME
-    ws[f'{text_col}{start_row}'].font = Font(bold=True, size=16, color=BRAND_COLOR_PRIMARY)
+    ws[f'{text_col}{start_row}'].font = COMPANY_NAME_FONT
     
     # Tagline
     ws[f'{text_col}{start_row+1}'] = COMPANY_TAGLINE
-    ws[f'{text_col}{start_row+1}'].font = Font(size=10, italic=True, color="666666")
+    ws[f'{text_col}{start_row+1}'].font = TAGLINE_FONT
     
     # Contact info
-    ws[f'{text_col}{start_row+2}'] = f"{COMPANY_PHONE} | {COMPANY_EMAIL}"
-    ws[f'{text_col}{start_row+2}'].font = Font(size=9, color="666666")
+    ws[f'{text_col}{start_row+2}'] = CONTACT_LINE
+    ws[f'{text_col}{start_row+2}'].font = CONTACT_FONT
     
     return start_row + 4  # Return next available row
 
-def create_workbook():
-    """Create and configure the complete workbook"""
+def create_workbook(now=None):
+    """Create and configure the complete workbook, dated now unless given"""
+    now = now or datetime.now()
     wb = Workbook()
+    # Results of formulas whose inputs are fixed at build time, per sheet
+    # title. save_workbook() writes them as cached values so readers that skip
+    # recalculation (e.g. openpyxl with data_only=True) still see numbers
+    wb.cached_values = {}
+    
+    # Drop the default sheet; the builders create every sheet themselves
+    wb.remove(wb.active)
     
-    # Remove default sheet
-    if 'Sheet' in wb.sheetnames:
-        wb.remove(wb['Sheet'])
-    
-    # Create all sheets in order
-    create_settings_sheet(wb)
-    create_customers_sheet(wb)
-    create_vendors_sheet(wb)
-    create_invoice_sheet(wb)
-    create_revenue_sheet(wb)
-    create_expenses_sheet(wb)
-    create_inventory_sheet(wb)
-    create_trade_debtors_sheet(wb)
-    create_cash_position_sheet(wb)
-    create_bank_reconciliation_sheet(wb)
-    create_profit_loss_sheet(wb)
-    create_balance_sheet_sheet(wb)
-    create_tax_summary_sheet(wb)
-    create_invoice_template_sheet(wb)
-    create_audit_log_sheet(wb)
-    create_dashboard_sheet(wb)
-    
-    # Hide Settings and Audit Log sheets
-    wb['Settings'].sheet_state = 'hidden'
-    wb['Audit Log'].sheet_state = 'hidden'
+    for style in NAMED_STYLES:
+        wb.add_named_style(style)
+    
+    sheets = {}
+    for name, builder, state in SHEET_BUILDERS:
+        sheets[name] = builder(wb, now)
+        sheets[name].sheet_state = state
+    
+    for name, ref in WORKBOOK_NAMES.items():
+        wb.defined_names[name] = DefinedName(name, attr_text=ref)
     
     # Set active sheet to Dashboard
-    wb.active = wb['Dashboard']
+    wb.active = sheets['Dashboard']
     
     return wb
 
 
 def apply_header_style(ws, row, start_col, end_col):
     """Apply consistent header styling"""
-    for col in range(start_col, end_col + 1):
-        cell = ws.cell(row=row, column=col)
-        cell.font = Font(bold=True, color="FFFFFF", size=11)
-        cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-        cell.border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-
-
-def create_settings_sheet(wb):
+    for cells in ws.iter_rows(min_row=row, max_row=row, min_col=start_col, max_col=end_col):
+        for cell in cells:
+            cell.style = 'header'
+
+
+def create_data_sheet(wb, title, headers, freeze='A2'):
+    """Create a sheet whose first row holds styled column headers"""
+    ws = wb.create_sheet(title)
+    ws.append(headers)
+    apply_header_style(ws, 1, 1, len(headers))
+    ws.freeze_panes = freeze
+    return ws
+
+
+def add_band(ws, cell_range, value, font, fill=None, alignment=None):
+    """Write a merged title band; only its top-left cell holds value and style"""
+    anchor = ws[cell_range.split(':')[0]]
+    anchor.value = value
+    anchor.font = font
+    if fill is not None:
+        anchor.fill = fill
+    if alignment is not None:
+        anchor.alignment = alignment
+    ws.merge_cells(cell_range)
+    return anchor
+
+
+def add_category_rows(ws, categories, start_row, columns, label=True):
+    """Write one row per expense category with a money formula per (column number, template)"""
+    for row, cat in enumerate(categories, start=start_row):
+        if label:
+            ws.cell(row=row, column=1, value=cat)
+            criterion = f'A{row}'
+        else:
+            criterion = f'"{cat}"'
+        for col, template in columns:
+            ws.cell(row=row, column=col, value=template % criterion).style = 'money'
+
+
+def add_value_rows(ws, rows, value_col=2):
+    """Write (row, label, value) rows with the value in the money style"""
+    for row, label, value in rows:
+        ws.cell(row=row, column=1, value=label)
+        ws.cell(row=row, column=value_col, value=value).style = 'money'
+
+
+def add_zero_check_formatting(ws, cell_range):
+    """Highlight a check cell green when it is zero and red otherwise"""
+    ws.conditional_formatting.add(cell_range,
+        CellIsRule(operator='equal', formula=['0'], stopIfTrue=True, fill=GOOD_FILL))
+    ws.conditional_formatting.add(cell_range,
+        CellIsRule(operator='notEqual', formula=['0'], stopIfTrue=True, fill=BAD_FILL))
+
+
+def set_column_widths(ws, widths, number_formats=None):
+    """Set the widths of columns A, B, ... in order; None keeps the default width"""
+    # Build each dimension complete instead of creating and then updating it.
+    # Neighbouring columns of equal width share one <col min..max> entry;
+    # columns given a default number format keep an entry of their own.
+    dimensions = ws.column_dimensions
+    number_formats = number_formats or {}
+    run = None
+    for idx, (col, width) in enumerate(zip(COL_LETTERS, widths), start=1):
+        if width is None:
+            run = None
+        elif run is not None and run.width == width and col not in number_formats:
+            run.max = idx
+        else:
+            run = dimensions[col] = ColumnDimension(ws, index=col, width=width, customWidth=True,
+                                                    min=idx, max=idx)
+            if col in number_formats:
+                run.number_format = number_formats[col]
+                run = None
+
+
+def add_list_validation(ws, formula, cell_range, error=None, error_title=None):
+    """Attach one drop-down list validation covering a whole range"""
+    validation = DataValidation(type="list", formula1=formula, allow_blank=False)
+    if error:
+        validation.error = error
+        validation.errorTitle = error_title
+    ws.add_data_validation(validation)
+    validation.add(cell_range)
+    return validation
+
+
+def data_range(col, sheet=None):
+    """Absolute reference to rows 2..MAX_DATA_ROW of a data column"""
+    ref = f"${col}$2:${col}${MAX_DATA_ROW}"
+    return f"{sheet}!{ref}" if sheet else ref
+
+
+def add_data_table(ws, name, headers):
+    """Turn the header row and first entry row into a named Excel Table"""
+    # No table style: the explicit header and cell styles stay in charge
+    ws.add_table(Table(displayName=name, ref=f"A1:{COL_LETTERS[len(headers) - 1]}2"))
+
+
+def set_cached_values(ws, **values):
+    """Record build-time results of formula cells on the workbook, keyed by coordinate"""
+    ws.parent.cached_values.setdefault(ws.title, {}).update(values)
+
+
+def fill_cached_values(sheet_xml, values):
+    """Write recorded results into the empty <v> of the matching formula cells"""
+    for coord, value in values.items():
+        sheet_xml = re.sub(rf'(<c r="{coord}"[^>]*><f>[^<]*</f>)<v\s*/?>(?:</v>)?',
+                           rf'\g<1><v>{value!r}</v>', sheet_xml, count=1)
+    return sheet_xml
+
+
+def make_trend_chart(data, categories, title):
+    """Build a monthly trend line chart; data includes the series title row"""
+    chart = LineChart()
+    chart.title = title
+    chart.style = 12
+    chart.y_axis.title = "Amount"
+    chart.x_axis.title = "Month"
+    chart.height = 10
+    chart.width = 20
+    
+    chart.add_data(data, titles_from_data=True)
+    chart.set_categories(categories)
+    return chart
+
+
+def create_settings_sheet(wb, now):
     """Create hidden Settings sheet for configuration"""
     ws = wb.create_sheet("Settings", 0)
     
     # Company Information Header
-    ws['A1'] = "COMPANY SETTINGS & CONFIGURATION"
-    ws['A1'].font = Font(bold=True, size=14, color="FFFFFF")
-    ws['A1'].fill = PatternFill(start_color=BRAND_COLOR_PRIMARY, end_color=BRAND_COLOR_PRIMARY, fill_type="solid")
-    ws.merge_cells('A1:B1')
-    
-    # Company Details Section
-    ws['A3'] = "Company Name"
-    ws['A3'].font = Font(bold=True)
-    ws['B3'] = COMPANY_NAME
-    
-    ws['A4'] = "Tagline"
-    ws['A4'].font = Font(bold=True)
-    ws['B4'] = COMPANY_TAGLINE
-    
-    ws['A5'] = "Email"
-    ws['A5'].font = Font(bold=True)
-    ws['B5'] = COMPANY_EMAIL
-    
-    ws['A6'] = "Phone"
-    ws['A6'].font = Font(bold=True)
-    ws['B6'] = COMPANY_PHONE
-    
-    ws['A7'] = "Address"
-    ws['A7'].font = Font(bold=True)
-    ws['B7'] = COMPANY_ADDRESS
-    
-    ws['A8'] = "Website"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'] = COMPANY_WEBSITE
-    
-    ws['A9'] = "Instagram"
-    ws['A9'].font = Font(bold=True)
-    ws['B9'] = COMPANY_IG
-    
-    ws['A10'] = "Logo Filename"
-    ws['A10'].font = Font(bold=True)
-    ws['B10'] = LOGO_FILENAME
-    ws['B10'].font = Font(italic=True, color="666666")
-    
-    # Financial Settings
-    ws['A12'] = "FINANCIAL SETTINGS"
-    ws['A12'].font = Font(bold=True, size=12, color="FFFFFF")
-    ws['A12'].fill = PatternFill(start_color=BRAND_COLOR_SECONDARY, end_color=BRAND_COLOR_SECONDARY, fill_type="solid")
-    ws.merge_cells('A12:B12')
-    
-    ws['A13'] = "VAT Rate (%)"
-    ws['A13'].font = Font(bold=True)
-    ws['B13'] = 15
-    ws['B13'].number_format = '0.00'
-    
-    ws['A14'] = "Financial Year Start"
-    ws['A14'].font = Font(bold=True)
-    ws['B14'] = "2025-01-01"
-    
-    # Opening Balances
-    ws['A16'] = "OPENING BALANCES"
-    ws['A16'].font = Font(bold=True, size=12, color="FFFFFF")
-    ws['A16'].fill = PatternFill(start_color=BRAND_COLOR_SECONDARY, end_color=BRAND_COLOR_SECONDARY, fill_type="solid")
-    ws.merge_cells('A16:B16')
-    
-    ws['A17'] = "Cash in Hand (Opening)"
-    ws['A17'].font = Font(bold=True)
-    ws['B17'] = 5000
-    ws['B17'].number_format = '#,##0.00'
-    
-    ws['A18'] = "Cash at Bank (Opening)"
-    ws['A18'].font = Font(bold=True)
-    ws['B18'] = 50000
-    ws['B18'].number_format = '#,##0.00'
-    
-    # Expense Categories
-    ws['A20'] = "EXPENSE CATEGORIES"
-    ws['A20'].font = Font(bold=True, size=12, color="FFFFFF")
-    ws['A20'].fill = PatternFill(start_color=BRAND_COLOR_SECONDARY, end_color=BRAND_COLOR_SECONDARY, fill_type="solid")
-    ws.merge_cells('A20:B20')
-    categories = [
-        "Equipment Purchase",
-        "Equipment Maintenance",
-        "Transport/Fuel",
-        "Salaries/Wages",
-        "Rent",
-        "Utilities",
-        "Insurance",
-        "Marketing",
-        "Office Supplies",
-        "Professional Fees",
-        "Bank Charges",
-        "Other"
-    ]
-    for idx, cat in enumerate(categories, start=21):
+    add_band(ws, 'A1:B1', "COMPANY SETTINGS & CONFIGURATION", TITLE_FONT, TITLE_FILL)
+    
+    # Section banners
+    for cell_range, title in (
+        ('A12:B12', "FINANCIAL SETTINGS"),
+        ('A16:B16', "OPENING BALANCES"),
+        ('A20:B20', "EXPENSE CATEGORIES"),
+        ('D20:E20', "PAYMENT METHODS"),
+    ):
+        add_band(ws, cell_range, title, SECTION_FONT, SECTION_FILL)
+    
+    # Label/value rows: (row, label, value, number format). Other sheets
+    # refer to these cells by address, so the row numbers are fixed
+    for row, label, value, number_format in (
+        (3, "Company Name", COMPANY_NAME, None),
+        (4, "Tagline", COMPANY_TAGLINE, None),
+        (5, "Email", COMPANY_EMAIL, None),
+        (6, "Phone", COMPANY_PHONE, None),
+        (7, "Address", COMPANY_ADDRESS, None),
+        (8, "Website", COMPANY_WEBSITE, None),
+        (9, "Instagram", COMPANY_IG, None),
+        (10, "Logo Filename", LOGO_FILENAME, None),
+        (13, "VAT Rate (%)", VAT_RATE_PERCENT, '0.00'),
+        (14, "Financial Year Start", "2025-01-01", None),
+        (15, "Report Date", "=TODAY()", DATE_FORMAT),
+        (17, "Cash in Hand (Opening)", OPENING_CASH, MONEY_FORMAT),
+        (18, "Cash at Bank (Opening)", OPENING_BANK, MONEY_FORMAT),
+    ):
+        ws.cell(row=row, column=1, value=label).font = BOLD_FONT
+        cell = ws.cell(row=row, column=2, value=value)
+        if number_format:
+            cell.number_format = number_format
+    ws['B10'].font = NOTE_FONT
+    
+    # Drop-down sources (see WORKBOOK_NAMES)
+    for idx, cat in enumerate(EXPENSE_CATEGORIES, start=21):
         ws[f'A{idx}'] = cat
     
-    # Payment Methods
-    ws['D20'] = "PAYMENT METHODS"
-    ws['D20'].font = Font(bold=True, size=12, color="FFFFFF")
-    ws['D20'].fill = PatternFill(start_color=BRAND_COLOR_SECONDARY, end_color=BRAND_COLOR_SECONDARY, fill_type="solid")
-    ws.merge_cells('D20:E20')
-    
-    payment_methods = ["Cash", "Bank Transfer", "Cheque", "Mobile Money", "Card"]
-    for idx, method in enumerate(payment_methods, start=21):
+    for idx, method in enumerate(PAYMENT_METHODS, start=21):
         ws[f'D{idx}'] = method
     
     # Set column widths
-    ws.column_dimensions['A'].width = 25
-    ws.column_dimensions['B'].width = 30
-    ws.column_dimensions['D'].width = 20
+    set_column_widths(ws, [25, 30, None, 20])
+    
+    return ws
 
 
-def create_customers_sheet(wb):
+def create_customers_sheet(wb, now):
     """Create Customers database sheet"""
-    ws = wb.create_sheet("Customers")
-    
     # Headers
     headers = [
         "Customer ID", "Company Name", "Contact Person", "Email", 
         "Phone", "Address", "City", "Payment Terms (Days)", 
         "Credit Limit", "Total Invoiced", "Total Paid", "Balance", "Status"
     ]
-    
-    for col, header in enumerate(headers, start=1):
-        cell = ws.cell(row=1, column=col, value=header)
-    
-    apply_header_style(ws, 1, 1, len(headers))
+    ws = create_data_sheet(wb, "Customers", headers)
     
     # Sample customers
     customers = [
@@ -277,67 +571,44 @@ def create_customers_sheet(wb):
          "+234 800 345 6789", "789 Celebration Rd", "Port Harcourt", 15, 75000),
     ]
     
-    for idx, (cust_id, company, contact, email, phone, address, city, terms, limit) in enumerate(customers, start=2):
-        ws[f'A{idx}'] = cust_id
-        ws[f'B{idx}'] = company
-        ws[f'C{idx}'] = contact
-        ws[f'D{idx}'] = email
-        ws[f'E{idx}'] = phone
-        ws[f'F{idx}'] = address
-        ws[f'G{idx}'] = city
-        ws[f'H{idx}'] = terms
-        ws[f'I{idx}'] = limit
-        ws[f'I{idx}'].number_format = '#,##0.00'
-        
-        # Total Invoiced
-        ws[f'J{idx}'] = f'=SUMIF(Invoices!$C:$C,B{idx},Invoices!$K:$K)'
-        ws[f'J{idx}'].number_format = '#,##0.00'
-        
-        # Total Paid
-        ws[f'K{idx}'] = f'=SUMIF(Invoices!$C:$C,B{idx},Invoices!$L:$L)'
-        ws[f'K{idx}'].number_format = '#,##0.00'
-        
-        # Balance
-        ws[f'L{idx}'] = f'=J{idx}-K{idx}'
-        ws[f'L{idx}'].number_format = '#,##0.00'
-        
-        # Status
-        ws[f'M{idx}'] = f'=IF(L{idx}=0,"Paid",IF(L{idx}>I{idx}*0.8,"Credit Warning","Active"))'
+    clients = data_range("C", "Invoices")
+    invoiced, received = data_range("K", "Invoices"), data_range("L", "Invoices")
+    for idx, customer in enumerate(customers, start=2):
+        ws.append(list(customer) + [
+            f'=SUMIF({clients},B{idx},{invoiced})',  # Total Invoiced
+            f'=SUMIF({clients},B{idx},{received})',  # Total Paid
+            f'=J{idx}-K{idx}',  # Balance
+            f'=IF(L{idx}=0,"Paid",IF(L{idx}>I{idx}*0.8,"Credit Warning","Active"))',  # Status
+        ])
+        for col in ('I', 'J', 'K', 'L'):
+            ws[f'{col}{idx}'].style = 'money'
     
     # Conditional formatting for status
     ws.conditional_formatting.add(f'M2:M{len(customers)+1}',
         CellIsRule(operator='equal', formula=['"Credit Warning"'], 
                    stopIfTrue=True, 
-                   fill=PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")))
+                   fill=BAD_FILL))
     
     ws.conditional_formatting.add(f'M2:M{len(customers)+1}',
         CellIsRule(operator='equal', formula=['"Paid"'], 
                    stopIfTrue=True, 
-                   fill=PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")))
+                   fill=GOOD_FILL))
     
     # Set column widths
-    widths = [12, 25, 20, 25, 18, 25, 15, 18, 15, 15, 15, 15, 15]
-    for idx, width in enumerate(widths, start=1):
-        ws.column_dimensions[get_column_letter(idx)].width = width
+    set_column_widths(ws, [12, 25, 20, 25, 18, 25, 15, 18, 15, 15, 15, 15, 15])
     
-    ws.freeze_panes = 'A2'
+    return ws
 
 
-def create_vendors_sheet(wb):
+def create_vendors_sheet(wb, now):
     """Create Vendors/Suppliers database sheet"""
-    ws = wb.create_sheet("Vendors")
-    
     # Headers
     headers = [
         "Vendor ID", "Company Name", "Contact Person", "Email", 
         "Phone", "Address", "City", "Payment Terms", 
         "Total Purchased", "Total Paid", "Balance Owed", "Status"
     ]
-    
-    for col, header in enumerate(headers, start=1):
-        cell = ws.cell(row=1, column=col, value=header)
-    
-    apply_header_style(ws, 1, 1, len(headers))
+    ws = create_data_sheet(wb, "Vendors", headers)
     
     # Sample vendors
     vendors = [
@@ -349,468 +620,355 @@ def create_vendors_sheet(wb):
          "+234 800 333 4444", "42 Lamp Lane", "Lagos", "Net 30"),
     ]
     
-    for idx, (vend_id, company, contact, email, phone, address, city, terms) in enumerate(vendors, start=2):
-        ws[f'A{idx}'] = vend_id
-        ws[f'B{idx}'] = company
-        ws[f'C{idx}'] = contact
-        ws[f'D{idx}'] = email
-        ws[f'E{idx}'] = phone
-        ws[f'F{idx}'] = address
-        ws[f'G{idx}'] = city
-        ws[f'H{idx}'] = terms
-        
-        # Total Purchased
-        ws[f'I{idx}'] = f'=SUMIF(Expenses!$C:$C,B{idx},Expenses!$E:$E)'
-        ws[f'I{idx}'].number_format = '#,##0.00'
-        
-        # For now, assume all paid (can be enhanced with payables tracking)
-        ws[f'J{idx}'] = f'=I{idx}'
-        ws[f'J{idx}'].number_format = '#,##0.00'
-        
-        # Balance Owed
-        ws[f'K{idx}'] = f'=I{idx}-J{idx}'
-        ws[f'K{idx}'].number_format = '#,##0.00'
-        
-        # Status
-        ws[f'L{idx}'] = f'=IF(K{idx}=0,"Current","Payable")'
+    for idx, vendor in enumerate(vendors, start=2):
+        ws.append(list(vendor) + [
+            f'=SUMIF({EXPENSES_TABLE}[Vendor],B{idx},{EXPENSES_TABLE}[Amount])',  # Total Purchased
+            f'=I{idx}',  # For now, assume all paid (can be enhanced with payables tracking)
+            f'=I{idx}-J{idx}',  # Balance Owed
+            f'=IF(K{idx}=0,"Current","Payable")',  # Status
+        ])
+        for col in ('I', 'J', 'K'):
+            ws[f'{col}{idx}'].style = 'money'
     
     # Set column widths
-    widths = [12, 25, 20, 25, 18, 25, 15, 15, 15, 15, 15, 12]
-    for idx, width in enumerate(widths, start=1):
-        ws.column_dimensions[get_column_letter(idx)].width = width
+    set_column_widths(ws, [12, 25, 20, 25, 18, 25, 15, 15, 15, 15, 15, 12])
     
-    ws.freeze_panes = 'A2'
+    return ws
 
 
-def create_invoice_sheet(wb):
+def create_invoice_sheet(wb, now):
     """Create Invoice Generator sheet"""
-    ws = wb.create_sheet("Invoices")
-    
     # Headers
     headers = [
         "Invoice No.", "Date", "Client Name", "Event Date", 
         "Items/Equipment", "Quantity", "Unit Price", "Subtotal",
         "VAT Rate", "VAT Amount", "Total Amount", "Amount Received", "Balance"
     ]
-    
-    for col, header in enumerate(headers, start=1):
-        cell = ws.cell(row=1, column=col, value=header)
-    
-    apply_header_style(ws, 1, 1, len(headers))
+    ws = create_data_sheet(wb, "Invoices", headers)
     
     # Sample data row 2 with formulas (template)
-    ws['A2'] = "INV-2025-001"
-    ws['B2'] = datetime(2025, 1, 15)
-    ws['B2'].number_format = 'YYYY-MM-DD'
-    ws['C2'] = "Sample Client Ltd"
-    ws['D2'] = datetime(2025, 1, 20)
-    ws['D2'].number_format = 'YYYY-MM-DD'
-    ws['E2'] = "LED Stage Lights x10, Sound System"
-    ws['F2'] = 1
-    ws['G2'] = 15000
-    ws['G2'].number_format = '#,##0.00'
-    
-    # Formulas
-    ws['H2'] = "=F2*G2"  # Subtotal
-    ws['H2'].number_format = '#,##0.00'
-    
-    ws['I2'] = "=Settings!$B$13/100"  # VAT Rate from Settings
-    ws['I2'].number_format = '0.00%'
-    
-    ws['J2'] = "=H2*I2"  # VAT Amount
-    ws['J2'].number_format = '#,##0.00'
-    
-    ws['K2'] = "=H2+J2"  # Total Amount
-    ws['K2'].number_format = '#,##0.00'
-    
-    ws['L2'] = 15000  # Amount Received
-    ws['L2'].number_format = '#,##0.00'
-    
-    ws['M2'] = "=K2-L2"  # Balance
-    ws['M2'].number_format = '#,##0.00'
+    quantity, unit_price, received = 1, 15000, 15000
+    ws.append([
+        "INV-2025-001", datetime(2025, 1, 15), "Sample Client Ltd", datetime(2025, 1, 20),
+        "LED Stage Lights x10, Sound System", quantity, unit_price,
+        "=F2*G2",  # Subtotal
+        "=VATRate/100",  # VAT Rate from Settings
+        "=H2*I2",  # VAT Amount
+        "=H2+J2",  # Total Amount
+        received,  # Amount Received
+        "=K2-L2",  # Balance
+        '=IF(M2=0,"Paid",IF(L2>0,"Partially Paid","Unpaid"))',  # Payment Status
+        "Bank Transfer",  # Payment Method
+    ])
+    for col in ('B', 'D'):
+        ws[f'{col}2'].style = 'ymd'
+    for col in ('G', 'H', 'J', 'K', 'L', 'M'):
+        ws[f'{col}2'].style = 'money'
+    ws['I2'].style = 'pct'
+    
+    subtotal = quantity * unit_price
+    vat_rate = VAT_RATE_PERCENT / 100
+    total = subtotal + subtotal * vat_rate
+    set_cached_values(ws, H2=subtotal, I2=vat_rate, J2=subtotal * vat_rate,
+                      K2=total, M2=total - received)
     
     # Data validation for Client Name (from Customers sheet)
-    customer_validation = DataValidation(type="list", formula1='=Customers!$B$2:$B$100', allow_blank=False)
-    customer_validation.error = 'Please select a valid customer from the list'
-    customer_validation.errorTitle = 'Invalid Customer'
-    ws.add_data_validation(customer_validation)
-    customer_validation.add('C2:C1000')
+    add_list_validation(ws, '=CustomerList', f'C2:C{MAX_DATA_ROW}',
+                        'Please select a valid customer from the list', 'Invalid Customer')
     
     # Data validation for Payment Status (custom list)
-    status_validation = DataValidation(type="list", formula1='"Paid,Partially Paid,Unpaid"', allow_blank=False)
-    ws.add_data_validation(status_validation)
-    status_validation.add('N2:N1000')  # Add a status column
+    add_list_validation(ws, '"Paid,Partially Paid,Unpaid"', f'N2:N{MAX_DATA_ROW}')  # Add a status column
     
     # Add Status column header
     ws['N1'] = 'Payment Status'
-    ws['N1'].font = Font(bold=True, color="FFFFFF", size=11)
-    ws['N1'].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    ws['N1'].alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    ws['N1'].font = HEADER_FONT
+    ws['N1'].fill = HEADER_FILL
+    ws['N1'].alignment = HEADER_ALIGNMENT
     
-    # Status formula
-    ws['N2'] = '=IF(M2=0,"Paid",IF(L2>0,"Partially Paid","Unpaid"))'
+    # How the money was received; Revenue carries it for the cash/bank split
+    ws['O1'] = 'Payment Method'
+    ws['O1'].style = 'header'
+    add_list_validation(ws, '=PaymentMethods', f'O2:O{MAX_DATA_ROW}',
+                        'Please select a payment method from the list', 'Invalid Payment Method')
     
     # Conditional formatting for Balance column
-    ws.conditional_formatting.add('M2:M1000',
+    ws.conditional_formatting.add(f'M2:M{MAX_DATA_ROW}',
         CellIsRule(operator='greaterThan', formula=['0'], 
                    stopIfTrue=True, 
-                   fill=PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")))
+                   fill=BAD_FILL))
     
-    ws.conditional_formatting.add('M2:M1000',
+    ws.conditional_formatting.add(f'M2:M{MAX_DATA_ROW}',
         CellIsRule(operator='equal', formula=['0'], 
                    stopIfTrue=True, 
-                   fill=PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")))
+                   fill=GOOD_FILL))
     
     # Set column widths
-    widths = [15, 12, 25, 12, 35, 10, 12, 12, 10, 12, 12, 15, 12, 15]
-    for idx, width in enumerate(widths, start=1):
-        ws.column_dimensions[get_column_letter(idx)].width = width
+    set_column_widths(ws, [15, 12, 25, 12, 35, 10, 12, 12, 10, 12, 12, 15, 12, 15, 18])
     
-    # Freeze header row
-    ws.freeze_panes = 'A2'
+    return ws
 
 
-def create_revenue_sheet(wb):
+def create_revenue_sheet(wb, now):
     """Create Cash Inflow / Revenue sheet"""
-    ws = wb.create_sheet("Revenue")
-    
     # Headers
     headers = [
         "Date", "Invoice No.", "Client Name", "Service/Equipment Provided",
-        "Quantity", "Unit Price", "Total Amount", "Amount Received", "Balance"
+        "Quantity", "Unit Price", "Total Amount", "Amount Received", "Balance",
+        "Payment Method"
     ]
-    
-    for col, header in enumerate(headers, start=1):
-        cell = ws.cell(row=1, column=col, value=header)
-    
-    apply_header_style(ws, 1, 1, len(headers))
+    ws = create_data_sheet(wb, "Revenue", headers)
     
     # Link to Invoices sheet - Row 2 pulls from Invoices
-    ws['A2'] = "=Invoices!B2"
-    ws['A2'].number_format = 'YYYY-MM-DD'
-    ws['B2'] = "=Invoices!A2"
-    ws['C2'] = "=Invoices!C2"
-    ws['D2'] = "=Invoices!E2"
-    ws['E2'] = "=Invoices!F2"
-    ws['F2'] = "=Invoices!G2"
-    ws['F2'].number_format = '#,##0.00'
-    ws['G2'] = "=Invoices!K2"
-    ws['G2'].number_format = '#,##0.00'
-    ws['H2'] = "=Invoices!L2"
-    ws['H2'].number_format = '#,##0.00'
-    ws['I2'] = "=Invoices!M2"
-    ws['I2'].number_format = '#,##0.00'
+    ws.append([f"=Invoices!{col}2" for col in ('B', 'A', 'C', 'E', 'F', 'G', 'K', 'L', 'M', 'O')])
+    ws['A2'].style = 'ymd'
+    for col in ('F', 'G', 'H', 'I'):
+        ws[f'{col}2'].style = 'money'
+    add_data_table(ws, REVENUE_TABLE, headers)
     
     # Summary section
-    ws['K1'] = "REVENUE SUMMARY"
-    ws['K1'].font = Font(bold=True, size=12)
+    received, dates = f"{REVENUE_TABLE}[Amount Received]", f"{REVENUE_TABLE}[Date]"
+    ws['L1'] = "REVENUE SUMMARY"
+    ws['L1'].font = SUMMARY_TITLE_FONT
     
-    ws['K3'] = "Today's Revenue"
-    ws['L3'] = f'=SUMIFS(H:H,A:A,TODAY())'
-    ws['L3'].number_format = '#,##0.00'
+    ws['L3'] = "Today's Revenue"
+    ws['M3'] = f'=SUMIFS({received},{dates},ReportDate)'
+    ws['M3'].style = 'money'
     
-    ws['K4'] = "This Month's Revenue"
-    ws['L4'] = f'=SUMIFS(H:H,A:A,">="&DATE(YEAR(TODAY()),MONTH(TODAY()),1),A:A,"<"&DATE(YEAR(TODAY()),MONTH(TODAY())+1,1))'
-    ws['L4'].number_format = '#,##0.00'
+    ws['L4'] = "This Month's Revenue"
+    ws['M4'] = f'=SUMIFS({received},{dates},">="&DATE(YEAR(ReportDate),MONTH(ReportDate),1),{dates},"<"&DATE(YEAR(ReportDate),MONTH(ReportDate)+1,1))'
+    ws['M4'].style = 'money'
     
-    ws['K5'] = "This Year's Revenue"
-    ws['L5'] = f'=SUMIFS(H:H,A:A,">="&DATE(YEAR(TODAY()),1,1),A:A,"<"&DATE(YEAR(TODAY())+1,1,1))'
-    ws['L5'].number_format = '#,##0.00'
+    ws['L5'] = "This Year's Revenue"
+    ws['M5'] = f'=SUMIFS({received},{dates},">="&DATE(YEAR(ReportDate),1,1),{dates},"<"&DATE(YEAR(ReportDate)+1,1,1))'
+    ws['M5'].style = 'money'
     
-    ws['K7'] = "Total Outstanding"
-    ws['L7'] = '=SUM(I:I)'
-    ws['L7'].number_format = '#,##0.00'
+    ws['L7'] = "Total Outstanding"
+    ws['M7'] = f'=SUM({REVENUE_TABLE}[Balance])'
+    ws['M7'].style = 'money'
     
     # Set column widths
-    widths = [12, 15, 25, 35, 10, 12, 12, 15, 12, 2, 20, 15]
-    for idx, width in enumerate(widths, start=1):
-        ws.column_dimensions[get_column_letter(idx)].width = width
+    set_column_widths(ws, [12, 15, 25, 35, 10, 12, 12, 15, 12, 15, 2, 20, 15])
     
-    ws.freeze_panes = 'A2'
+    return ws
 
 
-def create_expenses_sheet(wb):
+def create_expenses_sheet(wb, now):
     """Create Expenses sheet"""
-    ws = wb.create_sheet("Expenses")
-    
     # Headers
     headers = [
         "Date", "Expense Category", "Vendor", "Description", 
         "Amount", "Payment Method", "Reference"
     ]
-    
-    for col, header in enumerate(headers, start=1):
-        cell = ws.cell(row=1, column=col, value=header)
-    
-    apply_header_style(ws, 1, 1, len(headers))
+    ws = create_data_sheet(wb, "Expenses", headers)
     
     # Sample data
-    ws['A2'] = datetime(2025, 1, 10)
-    ws['A2'].number_format = 'YYYY-MM-DD'
-    ws['B2'] = "Equipment Purchase"
-    ws['C2'] = "Tech Supplies Ltd"
-    ws['D2'] = "10x LED Par Lights"
-    ws['E2'] = 25000
-    ws['E2'].number_format = '#,##0.00'
-    ws['F2'] = "Bank Transfer"
-    ws['G2'] = "TXN-001"
+    ws.append([datetime(2025, 1, 10), "Equipment Purchase", "Tech Supplies Ltd",
+               "10x LED Par Lights", 25000, "Bank Transfer", "TXN-001"])
+    ws['A2'].style = 'ymd'
+    ws['E2'].style = 'money'
+    add_data_table(ws, EXPENSES_TABLE, headers)
     
     # Summary section
+    amounts, dates, categories = (f"{EXPENSES_TABLE}[Amount]", f"{EXPENSES_TABLE}[Date]",
+                                  f"{EXPENSES_TABLE}[Expense Category]")
     ws['I1'] = "EXPENSE SUMMARY"
-    ws['I1'].font = Font(bold=True, size=12)
+    ws['I1'].font = SUMMARY_TITLE_FONT
     
     ws['I3'] = "This Month's Expenses"
-    ws['J3'] = f'=SUMIFS(E:E,A:A,">="&DATE(YEAR(TODAY()),MONTH(TODAY()),1),A:A,"<"&DATE(YEAR(TODAY()),MONTH(TODAY())+1,1))'
-    ws['J3'].number_format = '#,##0.00'
+    ws['J3'] = f'=SUMIFS({amounts},{dates},">="&DATE(YEAR(ReportDate),MONTH(ReportDate),1),{dates},"<"&DATE(YEAR(ReportDate),MONTH(ReportDate)+1,1))'
+    ws['J3'].style = 'money'
     
     ws['I4'] = "This Year's Expenses"
-    ws['J4'] = f'=SUMIFS(E:E,A:A,">="&DATE(YEAR(TODAY()),1,1),A:A,"<"&DATE(YEAR(TODAY())+1,1,1))'
-    ws['J4'].number_format = '#,##0.00'
+    ws['J4'] = f'=SUMIFS({amounts},{dates},">="&DATE(YEAR(ReportDate),1,1),{dates},"<"&DATE(YEAR(ReportDate)+1,1,1))'
+    ws['J4'].style = 'money'
     
     ws['I6'] = "By Category (YTD)"
-    ws['I6'].font = Font(bold=True)
+    ws['I6'].font = BOLD_FONT
     
     # Category summaries
-    categories = [
-        "Equipment Purchase", "Equipment Maintenance", "Transport/Fuel",
-        "Salaries/Wages", "Rent", "Utilities", "Insurance", "Marketing",
-        "Office Supplies", "Professional Fees", "Bank Charges", "Other"
-    ]
-    
-    for idx, cat in enumerate(categories, start=7):
+    for idx, cat in enumerate(EXPENSE_CATEGORIES, start=7):
         ws[f'I{idx}'] = cat
-        ws[f'J{idx}'] = f'=SUMIFS(E:E,B:B,I{idx},A:A,">="&DATE(YEAR(TODAY()),1,1))'
-        ws[f'J{idx}'].number_format = '#,##0.00'
+        ws[f'J{idx}'] = f'=SUMIFS({amounts},{categories},I{idx},{dates},">="&DATE(YEAR(ReportDate),1,1))'
+        ws[f'J{idx}'].style = 'money'
     
     # Data validation for Expense Category (from Settings sheet)
-    category_validation = DataValidation(type="list", formula1='=Settings!$A$21:$A$32', allow_blank=False)
-    category_validation.error = 'Please select a valid expense category'
-    category_validation.errorTitle = 'Invalid Category'
-    ws.add_data_validation(category_validation)
-    category_validation.add('B2:B1000')
+    add_list_validation(ws, '=ExpenseCategories', f'B2:B{MAX_DATA_ROW}',
+                        'Please select a valid expense category', 'Invalid Category')
     
     # Data validation for Vendor (from Vendors sheet)
-    vendor_validation = DataValidation(type="list", formula1='=Vendors!$B$2:$B$100', allow_blank=False)
-    vendor_validation.error = 'Please select a valid vendor'
-    vendor_validation.errorTitle = 'Invalid Vendor'
-    ws.add_data_validation(vendor_validation)
-    vendor_validation.add('C2:C1000')
+    add_list_validation(ws, '=VendorList', f'C2:C{MAX_DATA_ROW}',
+                        'Please select a valid vendor', 'Invalid Vendor')
     
     # Data validation for Payment Method (from Settings sheet)
-    payment_validation = DataValidation(type="list", formula1='=Settings!$D$21:$D$25', allow_blank=False)
-    payment_validation.error = 'Please select a valid payment method'
-    payment_validation.errorTitle = 'Invalid Payment Method'
-    ws.add_data_validation(payment_validation)
-    payment_validation.add('F2:F1000')
+    add_list_validation(ws, '=PaymentMethods', f'F2:F{MAX_DATA_ROW}',
+                        'Please select a valid payment method', 'Invalid Payment Method')
     
     # Set column widths
-    widths = [12, 20, 25, 35, 12, 18, 15, 2, 25, 15]
-    for idx, width in enumerate(widths, start=1):
-        ws.column_dimensions[get_column_letter(idx)].width = width
+    set_column_widths(ws, [12, 20, 25, 35, 12, 18, 15, 2, 25, 15])
     
-    ws.freeze_panes = 'A2'
+    return ws
 
 
-def create_inventory_sheet(wb):
+def create_inventory_sheet(wb, now):
     """Create Stock / Inventory sheet"""
-    ws = wb.create_sheet("Inventory")
-    
     # Headers
     headers = [
         "Stock ID", "Item Description", "Unit Price", "Quantity in Store",
         "Quantity Rented Out", "Stock in Transit", "Total Quantity", "Total Stock Value"
     ]
-    
-    for col, header in enumerate(headers, start=1):
-        cell = ws.cell(row=1, column=col, value=header)
-    
-    apply_header_style(ws, 1, 1, len(headers))
+    ws = create_data_sheet(wb, "Inventory", headers)
     
     # Sample data with formulas
-    inventory_items = [
-        ("STK-001", "LED Par Light", 2500, 20, 5, 0),
-        ("STK-002", "Moving Head Light", 8000, 10, 3, 2),
-        ("STK-003", "Sound System (Complete)", 45000, 3, 1, 0),
-        ("STK-004", "Smoke Machine", 3500, 8, 2, 0),
-        ("STK-005", "DMX Controller", 5000, 5, 1, 0),
-        ("STK-006", "Lighting Truss (per meter)", 800, 50, 20, 0),
-        ("STK-007", "Power Distribution Box", 1200, 15, 5, 0),
-        ("STK-008", "Microphone (Wireless)", 1500, 12, 4, 0),
-        ("STK-009", "Speaker (500W)", 6000, 8, 3, 1),
-        ("STK-010", "Cable Set (Complete)", 300, 30, 10, 5),
-    ]
-    
-    for idx, (stock_id, desc, price, in_store, rented, transit) in enumerate(inventory_items, start=2):
-        ws[f'A{idx}'] = stock_id
-        ws[f'B{idx}'] = desc
-        ws[f'C{idx}'] = price
-        ws[f'C{idx}'].number_format = '#,##0.00'
-        ws[f'D{idx}'] = in_store
-        ws[f'E{idx}'] = rented
-        ws[f'F{idx}'] = transit
-        
-        # Total Quantity formula
-        ws[f'G{idx}'] = f'=D{idx}+E{idx}+F{idx}'
-        
-        # Total Stock Value formula
-        ws[f'H{idx}'] = f'=C{idx}*G{idx}'
-        ws[f'H{idx}'].number_format = '#,##0.00'
+    for idx, item in enumerate(INVENTORY_ITEMS, start=2):
+        ws.append(list(item) + [
+            f'=D{idx}+E{idx}+F{idx}',  # Total Quantity
+            f'=C{idx}*G{idx}',  # Total Stock Value
+        ])
+        for col in ('C', 'H'):
+            ws[f'{col}{idx}'].style = 'money'
+        unit_price, in_store, rented, in_transit = item[2:]
+        total_qty = in_store + rented + in_transit
+        set_cached_values(ws, **{f'G{idx}': total_qty, f'H{idx}': unit_price * total_qty})
     
     # Summary section
-    last_row = len(inventory_items) + 2
+    last_row = STOCK_TOTAL_ROW
     ws[f'A{last_row}'] = "TOTAL STOCK VALUE"
-    ws[f'A{last_row}'].font = Font(bold=True, size=11)
+    ws[f'A{last_row}'].font = BOLD_FONT
     ws[f'H{last_row}'] = f'=SUM(H2:H{last_row-1})'
-    ws[f'H{last_row}'].number_format = '#,##0.00'
-    ws[f'H{last_row}'].font = Font(bold=True)
-    ws[f'H{last_row}'].fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
+    set_cached_values(ws, **{f'H{last_row}': sum(item[2] * sum(item[3:]) for item in INVENTORY_ITEMS)})
+    ws[f'H{last_row}'].style = 'money_total'
     
     # Additional summary
     ws[f'J3'] = "Available for Rent"
-    ws[f'K3'] = f'=SUM(D:D)'
+    ws[f'K3'] = f'=SUM(D2:D{last_row-1})'
     
     ws[f'J4'] = "Currently Rented"
-    ws[f'K4'] = f'=SUM(E:E)'
+    ws[f'K4'] = f'=SUM(E2:E{last_row-1})'
     
     ws[f'J5'] = "In Transit"
-    ws[f'K5'] = f'=SUM(F:F)'
+    ws[f'K5'] = f'=SUM(F2:F{last_row-1})'
     
     # Set column widths
-    widths = [12, 30, 12, 18, 18, 15, 15, 18, 2, 20, 15]
-    for idx, width in enumerate(widths, start=1):
-        ws.column_dimensions[get_column_letter(idx)].width = width
+    set_column_widths(ws, [12, 30, 12, 18, 18, 15, 15, 18, 2, 20, 15])
     
-    ws.freeze_panes = 'A2'
+    return ws
 
 
-def create_trade_debtors_sheet(wb):
+def create_trade_debtors_sheet(wb, now):
     """Create Trade Debtors (Accounts Receivable) sheet"""
-    ws = wb.create_sheet("Trade Debtors")
-    
     # Headers
     headers = [
         "Invoice No.", "Date", "Client Name", "Amount Owed", 
         "Due Date", "Days Outstanding", "Status"
     ]
-    
-    for col, header in enumerate(headers, start=1):
-        cell = ws.cell(row=1, column=col, value=header)
-    
-    apply_header_style(ws, 1, 1, len(headers))
+    ws = create_data_sheet(wb, "Trade Debtors", headers, freeze='A4')
     
     # Instructions
     ws['A2'] = "This sheet auto-populates from Invoices where Balance > 0"
-    ws['A2'].font = Font(italic=True, color="666666")
+    ws['A2'].font = NOTE_FONT
     ws.merge_cells('A2:G2')
     
     # Formula to pull unpaid invoices
     # Row 4 onwards will contain the actual data
-    ws['A4'] = '=IFERROR(INDEX(Invoices!$A:$A,SMALL(IF(Invoices!$M$2:$M$1000>0,ROW(Invoices!$M$2:$M$1000)),ROW()-3)),"")'
-    ws['B4'] = '=IFERROR(INDEX(Invoices!$B:$B,MATCH(A4,Invoices!$A:$A,0)),"")'
-    ws['B4'].number_format = 'YYYY-MM-DD'
-    ws['C4'] = '=IFERROR(INDEX(Invoices!$C:$C,MATCH(A4,Invoices!$A:$A,0)),"")'
-    ws['D4'] = '=IFERROR(INDEX(Invoices!$M:$M,MATCH(A4,Invoices!$A:$A,0)),"")'
-    ws['D4'].number_format = '#,##0.00'
+    # SMALL(IF(...)) only works when entered as an array formula (Ctrl+Shift+Enter);
+    # FILTER() would spill instead but needs metadata openpyxl does not write
+    # The ranges start at row 2, so ROW()-1 is the position within them
+    numbers, balances = data_range("A", "Invoices"), data_range("M", "Invoices")
+    ws['A4'] = ArrayFormula('A4', f'=IFERROR(INDEX({numbers},SMALL(IF({balances}>0,ROW({balances})-1),ROW()-3)),"")')
+    ws['B4'] = f'=IFERROR(INDEX({data_range("B", "Invoices")},MATCH(A4,{numbers},0)),"")'
+    ws['B4'].style = 'ymd'
+    ws['C4'] = f'=IFERROR(INDEX({data_range("C", "Invoices")},MATCH(A4,{numbers},0)),"")'
+    ws['D4'] = f'=IFERROR(INDEX({balances},MATCH(A4,{numbers},0)),"")'
+    ws['D4'].style = 'money'
     ws['E4'] = '=IFERROR(B4+30,"")'  # Due date = Invoice date + 30 days
-    ws['E4'].number_format = 'YYYY-MM-DD'
-    ws['F4'] = '=IFERROR(IF(A4<>"",TODAY()-B4,""),"")'
+    ws['E4'].style = 'ymd'
+    ws['F4'] = '=IFERROR(IF(A4<>"",ReportDate-B4,""),"")'
     ws['G4'] = '=IFERROR(IF(F4="","",IF(F4>60,"Overdue",IF(F4>30,"Due Soon","Current"))),"")'
     
     # Summary
-    ws['I3'] = "Total Outstanding"
-    ws['J3'] = '=SUM(D:D)'
-    ws['J3'].number_format = '#,##0.00'
-    ws['J3'].font = Font(bold=True)
-    
-    ws['I5'] = "Current (0-30 days)"
-    ws['J5'] = '=SUMIF(G:G,"Current",D:D)'
-    ws['J5'].number_format = '#,##0.00'
-    
-    ws['I6'] = "Due Soon (31-60 days)"
-    ws['J6'] = '=SUMIF(G:G,"Due Soon",D:D)'
-    ws['J6'].number_format = '#,##0.00'
-    
-    ws['I7'] = "Overdue (>60 days)"
-    ws['J7'] = '=SUMIF(G:G,"Overdue",D:D)'
-    ws['J7'].number_format = '#,##0.00'
+    # The aging rows follow the total, one blank row below it
+    owed, status = f"D4:D{MAX_DATA_ROW}", f"G4:G{MAX_DATA_ROW}"
+    total = RECEIVABLES_ROW
+    ws[f'I{total}'] = "Total Outstanding"
+    ws[f'J{total}'] = f'=SUM({owed})'
+    ws[f'J{total}'].style = 'money_bold'
+    
+    for row, (label, bucket) in enumerate((
+        ("Current (0-30 days)", "Current"),
+        ("Due Soon (31-60 days)", "Due Soon"),
+        ("Overdue (>60 days)", "Overdue"),
+    ), start=total + 2):
+        ws[f'I{row}'] = label
+        ws[f'J{row}'] = f'=SUMIF({status},"{bucket}",{owed})'
+        ws[f'J{row}'].style = 'money'
     
     # Set column widths
-    widths = [15, 12, 25, 15, 12, 18, 15, 2, 20, 15]
-    for idx, width in enumerate(widths, start=1):
-        ws.column_dimensions[get_column_letter(idx)].width = width
+    set_column_widths(ws, [15, 12, 25, 15, 12, 18, 15, 2, 20, 15])
     
-    ws.freeze_panes = 'A4'
+    return ws
 
 
-def create_cash_position_sheet(wb):
+def create_cash_position_sheet(wb, now):
     """Create Cash Position sheet"""
     ws = wb.create_sheet("Cash Position")
     
     # Title
     ws['A1'] = "CASH POSITION STATEMENT"
-    ws['A1'].font = Font(bold=True, size=14)
+    ws['A1'].font = HEADING_FONT
     ws.merge_cells('A1:D1')
     
-    ws['A2'] = f"As at: {datetime.now().strftime('%Y-%m-%d')}"
+    ws['A2'] = '="As at: "&TEXT(ReportDate,"YYYY-MM-DD")'
     ws.merge_cells('A2:D2')
     
-    # Cash in Hand section
-    ws['A4'] = "CASH IN HAND"
-    ws['A4'].font = Font(bold=True, size=12)
-    apply_header_style(ws, 4, 1, 2)
-    
-    ws['A5'] = "Opening Balance"
-    ws['B5'] = "=Settings!B17"
-    ws['B5'].number_format = '#,##0.00'
-    
-    ws['A6'] = "Cash Received (YTD)"
-    ws['B6'] = '=SUMIFS(Revenue!H:H,Revenue!A:A,">="&Settings!$B$14,Expenses!F:F,"Cash")'
-    ws['B6'].number_format = '#,##0.00'
-    
-    ws['A7'] = "Cash Paid (YTD)"
-    ws['B7'] = '=SUMIFS(Expenses!E:E,Expenses!A:A,">="&Settings!$B$14,Expenses!F:F,"Cash")'
-    ws['B7'].number_format = '#,##0.00'
-    
-    ws['A8'] = "Closing Cash in Hand"
-    ws['B8'] = "=B5+B6-B7"
-    ws['B8'].number_format = '#,##0.00'
-    ws['B8'].font = Font(bold=True)
-    ws['B8'].fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-    
-    # Cash at Bank section
-    ws['A10'] = "CASH AT BANK"
-    ws['A10'].font = Font(bold=True, size=12)
-    apply_header_style(ws, 10, 1, 2)
-    
-    ws['A11'] = "Opening Balance"
-    ws['B11'] = "=Settings!B18"
-    ws['B11'].number_format = '#,##0.00'
+    # Each section is a header, three movements and its closing balance,
+    # which sits on the row WORKBOOK_NAMES points at
+    hand, bank = CASH_IN_HAND_ROW, CASH_AT_BANK_ROW
     
-    ws['A12'] = "Bank Receipts (YTD)"
-    ws['B12'] = '=SUMIFS(Revenue!H:H,Revenue!A:A,">="&Settings!$B$14)-B6'
-    ws['B12'].number_format = '#,##0.00'
-    
-    ws['A13'] = "Bank Payments (YTD)"
-    ws['B13'] = '=SUMIFS(Expenses!E:E,Expenses!A:A,">="&Settings!$B$14)-B7'
-    ws['B13'].number_format = '#,##0.00'
-    
-    ws['A14'] = "Closing Cash at Bank"
-    ws['B14'] = "=B11+B12-B13"
-    ws['B14'].number_format = '#,##0.00'
-    ws['B14'].font = Font(bold=True)
-    ws['B14'].fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+    # Cash in Hand section
+    ws[f'A{hand-4}'] = "CASH IN HAND"
+    ws[f'A{hand-4}'].font = SUMMARY_TITLE_FONT
+    apply_header_style(ws, hand-4, 1, 2)
+    
+    add_value_rows(ws, (
+        (hand-3, "Opening Balance", "=OpeningCash"),
+        (hand-2, "Cash Received (YTD)", f'=SUMIFS({REVENUE_TABLE}[Amount Received],{REVENUE_TABLE}[Date],">="&FYStart,{REVENUE_TABLE}[Payment Method],"Cash")'),
+        (hand-1, "Cash Paid (YTD)", f'=SUMIFS({EXPENSES_TABLE}[Amount],{EXPENSES_TABLE}[Date],">="&FYStart,{EXPENSES_TABLE}[Payment Method],"Cash")'),
+    ))
+    
+    ws[f'A{hand}'] = "Closing Cash in Hand"
+    ws[f'B{hand}'] = f"=B{hand-3}+B{hand-2}-B{hand-1}"
+    ws[f'B{hand}'].style = 'money_bold'
+    ws[f'B{hand}'].fill = SUBTOTAL_FILL
+    
+    # Cash at Bank section; bank receipts/payments are whatever was not cash
+    ws[f'A{bank-4}'] = "CASH AT BANK"
+    ws[f'A{bank-4}'].font = SUMMARY_TITLE_FONT
+    apply_header_style(ws, bank-4, 1, 2)
+    
+    add_value_rows(ws, (
+        (bank-3, "Opening Balance", "=OpeningBank"),
+        (bank-2, "Bank Receipts (YTD)", f'=SUMIFS({REVENUE_TABLE}[Amount Received],{REVENUE_TABLE}[Date],">="&FYStart)-B{hand-2}'),
+        (bank-1, "Bank Payments (YTD)", f'=SUMIFS({EXPENSES_TABLE}[Amount],{EXPENSES_TABLE}[Date],">="&FYStart)-B{hand-1}'),
+    ))
+    set_cached_values(ws, **{f'B{hand-3}': OPENING_CASH, f'B{bank-3}': OPENING_BANK})
+    
+    ws[f'A{bank}'] = "Closing Cash at Bank"
+    ws[f'B{bank}'] = f"=B{bank-3}+B{bank-2}-B{bank-1}"
+    ws[f'B{bank}'].style = 'money_bold'
+    ws[f'B{bank}'].fill = SUBTOTAL_FILL
     
     # Total Cash Position
-    ws['A16'] = "TOTAL CASH POSITION"
-    ws['A16'].font = Font(bold=True, size=13)
-    ws['B16'] = "=B8+B14"
-    ws['B16'].number_format = '#,##0.00'
-    ws['B16'].font = Font(bold=True, size=13)
-    ws['B16'].fill = PatternFill(start_color="B4C7E7", end_color="B4C7E7", fill_type="solid")
+    total = bank + 2
+    ws[f'A{total}'] = "TOTAL CASH POSITION"
+    ws[f'A{total}'].font = TOTAL_FONT
+    ws[f'B{total}'] = f"=B{hand}+B{bank}"
+    ws[f'B{total}'].style = 'money'
+    ws[f'B{total}'].font = TOTAL_FONT
+    ws[f'B{total}'].fill = GRAND_TOTAL_FILL
     
     # Monthly Breakdown
     ws['D4'] = "MONTHLY CASH FLOW"
-    ws['D4'].font = Font(bold=True, size=12)
+    ws['D4'].font = SUMMARY_TITLE_FONT
     ws.merge_cells('D4:F4')
     
     ws['D5'] = "Month"
@@ -819,59 +977,53 @@ def create_cash_position_sheet(wb):
     ws['G5'] = "Net"
     apply_header_style(ws, 5, 4, 7)
     
-    # Sample months (would need dynamic generation for full year)
-    months = ["January", "February", "March", "April", "May", "June", 
-              "July", "August", "September", "October", "November", "December"]
-    
-    for idx, month in enumerate(months, start=6):
-        month_num = idx - 5
-        ws[f'D{idx}'] = month
-        ws[f'E{idx}'] = f'=SUMIFS(Revenue!H:H,Revenue!A:A,">="&DATE(YEAR(TODAY()),{month_num},1),Revenue!A:A,"<"&DATE(YEAR(TODAY()),{month_num}+1,1))'
-        ws[f'E{idx}'].number_format = '#,##0.00'
-        ws[f'F{idx}'] = f'=SUMIFS(Expenses!E:E,Expenses!A:A,">="&DATE(YEAR(TODAY()),{month_num},1),Expenses!A:A,"<"&DATE(YEAR(TODAY()),{month_num}+1,1))'
-        ws[f'F{idx}'].number_format = '#,##0.00'
-        ws[f'G{idx}'] = f'=E{idx}-F{idx}'
-        ws[f'G{idx}'].number_format = '#,##0.00'
+    # Columns A:B beside these rows hold the balances, so rows cannot be appended
+    for month_num, (inflow, outflow) in enumerate(MONTHLY_FLOW_FORMULAS, start=1):
+        row = FIRST_MONTH_ROW - 1 + month_num
+        ws.cell(row=row, column=4, value=calendar.month_name[month_num])
+        for col, value in ((5, inflow), (6, outflow), (7, f'=E{row}-F{row}')):
+            ws.cell(row=row, column=col, value=value).style = 'money'
+        # Month boundaries used by MONTHLY_FLOW_FORMULAS
+        ws.cell(row=row, column=8, value=f'=DATE(YEAR(ReportDate),{month_num},1)').style = 'ymd'
+        ws.cell(row=row, column=9, value=f'=EDATE(H{row},1)').style = 'ymd'
     
     # Set column widths
-    ws.column_dimensions['A'].width = 25
-    ws.column_dimensions['B'].width = 18
-    ws.column_dimensions['C'].width = 3
-    ws.column_dimensions['D'].width = 15
-    ws.column_dimensions['E'].width = 15
-    ws.column_dimensions['F'].width = 15
-    ws.column_dimensions['G'].width = 15
+    set_column_widths(ws, [25, 18, 3, 15, 15, 15, 15])
+    for col in ('H', 'I'):
+        ws.column_dimensions[col].hidden = True
+    
+    return ws
 
 
-def create_bank_reconciliation_sheet(wb):
+def create_bank_reconciliation_sheet(wb, now):
     """Create Bank Reconciliation sheet like QuickBooks"""
     ws = wb.create_sheet("Bank Reconciliation")
     
     # Title section
     ws['A1'] = "BANK RECONCILIATION STATEMENT"
-    ws['A1'].font = Font(bold=True, size=14, color="FFFFFF")
-    ws['A1'].fill = PatternFill(start_color="203864", end_color="203864", fill_type="solid")
+    ws['A1'].font = TITLE_FONT
+    ws['A1'].fill = TITLE_FILL
     ws.merge_cells('A1:F1')
-    ws['A1'].alignment = Alignment(horizontal="center")
+    ws['A1'].alignment = CENTER_ALIGNMENT
     
-    ws['A2'] = f"As at: {datetime.now().strftime('%Y-%m-%d')}"
-    ws['A2'].font = Font(size=11)
+    ws['A2'] = '="As at: "&TEXT(ReportDate,"YYYY-MM-DD")'
+    ws['A2'].font = BODY_FONT
     ws.merge_cells('A2:F2')
-    ws['A2'].alignment = Alignment(horizontal="center")
+    ws['A2'].alignment = CENTER_ALIGNMENT
     
     # Bank Statement Section
     ws['A4'] = "BANK STATEMENT BALANCE"
-    ws['A4'].font = Font(bold=True, size=12)
+    ws['A4'].font = SUMMARY_TITLE_FONT
     apply_header_style(ws, 4, 1, 2)
     
     ws['A5'] = "Bank Statement Balance"
     ws['B5'] = 50000  # Default value, user should update
-    ws['B5'].number_format = '#,##0.00'
-    ws['B5'].fill = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
+    ws['B5'].style = 'money'
+    ws['B5'].fill = HIGHLIGHT_FILL
     
     # Outstanding Transactions
     ws['A7'] = "OUTSTANDING DEPOSITS (Not yet cleared)"
-    ws['A7'].font = Font(bold=True, size=11)
+    ws['A7'].font = BOLD_FONT
     apply_header_style(ws, 7, 1, 3)
     
     ws['A8'] = "Date"
@@ -880,21 +1032,20 @@ def create_bank_reconciliation_sheet(wb):
     apply_header_style(ws, 8, 1, 3)
     
     # Sample outstanding deposit
-    ws['A9'] = datetime.now()
-    ws['A9'].number_format = 'YYYY-MM-DD'
+    ws['A9'] = now
+    ws['A9'].style = 'ymd'
     ws['B9'] = "Client payment in transit"
     ws['C9'] = 0
-    ws['C9'].number_format = '#,##0.00'
+    ws['C9'].style = 'money'
     
     ws['A11'] = "Total Outstanding Deposits"
-    ws['A11'].font = Font(bold=True)
+    ws['A11'].font = BOLD_FONT
     ws['C11'] = '=SUM(C9:C10)'
-    ws['C11'].number_format = '#,##0.00'
-    ws['C11'].font = Font(bold=True)
+    ws['C11'].style = 'money_bold'
     
     # Outstanding Checks
     ws['A13'] = "OUTSTANDING CHECKS/PAYMENTS (Not yet cleared)"
-    ws['A13'].font = Font(bold=True, size=11)
+    ws['A13'].font = BOLD_FONT
     apply_header_style(ws, 13, 1, 3)
     
     ws['A14'] = "Date"
@@ -903,83 +1054,74 @@ def create_bank_reconciliation_sheet(wb):
     apply_header_style(ws, 14, 1, 3)
     
     # Sample outstanding check
-    ws['A15'] = datetime.now()
-    ws['A15'].number_format = 'YYYY-MM-DD'
+    ws['A15'] = now
+    ws['A15'].style = 'ymd'
     ws['B15'] = "CHQ-001 to vendor"
     ws['C15'] = 0
-    ws['C15'].number_format = '#,##0.00'
+    ws['C15'].style = 'money'
     
     ws['A17'] = "Total Outstanding Checks"
-    ws['A17'].font = Font(bold=True)
+    ws['A17'].font = BOLD_FONT
     ws['C17'] = '=SUM(C15:C16)'
-    ws['C17'].number_format = '#,##0.00'
-    ws['C17'].font = Font(bold=True)
+    ws['C17'].style = 'money_bold'
     
     # Reconciliation Summary
     ws['A19'] = "RECONCILIATION SUMMARY"
-    ws['A19'].font = Font(bold=True, size=12, color="FFFFFF")
-    ws['A19'].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    ws['A19'].font = SECTION_FONT
+    ws['A19'].fill = SECTION_FILL
     ws.merge_cells('A19:B19')
     
     ws['A20'] = "Bank Statement Balance"
     ws['B20'] = '=B5'
-    ws['B20'].number_format = '#,##0.00'
+    ws['B20'].style = 'money'
     
     ws['A21'] = "Add: Outstanding Deposits"
     ws['B21'] = '=C11'
-    ws['B21'].number_format = '#,##0.00'
+    ws['B21'].style = 'money'
     
     ws['A22'] = "Less: Outstanding Checks"
     ws['B22'] = '=-C17'
-    ws['B22'].number_format = '#,##0.00'
+    ws['B22'].style = 'money'
     
     ws['A23'] = "Adjusted Bank Balance"
-    ws['B23'] = '=B20+B21+B22'
-    ws['B23'].number_format = '#,##0.00'
-    ws['B23'].font = Font(bold=True, size=12)
-    ws['B23'].fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+    ws['B23'] = '=B5+C11-C17'
+    ws['B23'].style = 'money'
+    ws['B23'].font = SUMMARY_TITLE_FONT
+    ws['B23'].fill = SUBTOTAL_FILL
     
     ws['A25'] = "Book Balance (Per Cash Position)"
-    ws['B25'] = "='Cash Position'!B14"
-    ws['B25'].number_format = '#,##0.00'
-    ws['B25'].font = Font(bold=True)
+    ws['B25'] = "=CashAtBank"
+    ws['B25'].style = 'money_bold'
     
     ws['A27'] = "DIFFERENCE (Should be zero)"
-    ws['A27'].font = Font(bold=True)
+    ws['A27'].font = BOLD_FONT
     ws['B27'] = '=B23-B25'
-    ws['B27'].number_format = '#,##0.00'
-    ws['B27'].font = Font(bold=True, size=12)
+    ws['B27'].style = 'money'
+    ws['B27'].font = SUMMARY_TITLE_FONT
     
     # Conditional formatting for difference
-    ws.conditional_formatting.add('B27:B27',
-        CellIsRule(operator='equal', formula=['0'], 
-                   stopIfTrue=True, 
-                   fill=PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")))
-    
-    ws.conditional_formatting.add('B27:B27',
-        CellIsRule(operator='notEqual', formula=['0'], 
-                   stopIfTrue=True, 
-                   fill=PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")))
+    add_zero_check_formatting(ws, 'B27:B27')
     
     # Set column widths
-    ws.column_dimensions['A'].width = 35
-    ws.column_dimensions['B'].width = 35
-    ws.column_dimensions['C'].width = 18
+    set_column_widths(ws, [35, 35, 18])
     
+    
+    return ws
+
 
-def create_profit_loss_sheet(wb):
+def create_profit_loss_sheet(wb, now):
     """Create professional Profit & Loss Statement like QuickBooks"""
     ws = wb.create_sheet("Profit & Loss")
     
     # Title
     ws['A1'] = "PROFIT & LOSS STATEMENT"
-    ws['A1'].font = Font(bold=True, size=16, color="FFFFFF")
-    ws['A1'].fill = PatternFill(start_color="203864", end_color="203864", fill_type="solid")
-    ws['A1'].alignment = Alignment(horizontal="center")
+    ws['A1'].font = REPORT_TITLE_FONT
+    ws['A1'].fill = TITLE_FILL
+    ws['A1'].alignment = CENTER_ALIGNMENT
     ws.merge_cells('A1:D1')
     
-    ws['A2'] = f"For the period: January 1, 2025 - {datetime.now().strftime('%B %d, %Y')}"
-    ws['A2'].alignment = Alignment(horizontal="center")
+    ws['A2'] = '="For the period: January 1, 2025 - "&TEXT(ReportDate,"MMMM DD, YYYY")'
+    ws['A2'].alignment = CENTER_ALIGNMENT
     ws.merge_cells('A2:D2')
     
     # Column Headers
@@ -989,353 +1131,287 @@ def create_profit_loss_sheet(wb):
     
     # REVENUE SECTION
     ws['A5'] = "REVENUE"
-    ws['A5'].font = Font(bold=True, size=13, color="FFFFFF")
-    ws['A5'].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    ws['A5'].font = LARGE_SECTION_FONT
+    ws['A5'].fill = SECTION_FILL
     ws.merge_cells('A5:B5')
     
     ws['A6'] = "Service Revenue"
-    ws['C6'] = '=Revenue!L4'
-    ws['C6'].number_format = '#,##0.00'
-    ws['D6'] = '=Revenue!L5'
-    ws['D6'].number_format = '#,##0.00'
+    ws['C6'] = '=Revenue!M4'
+    ws['C6'].style = 'money'
+    ws['D6'] = '=Revenue!M5'
+    ws['D6'].style = 'money'
     
     ws['A7'] = "Total Revenue"
-    ws['A7'].font = Font(bold=True)
+    ws['A7'].font = BOLD_FONT
     ws['C7'] = '=C6'
-    ws['C7'].number_format = '#,##0.00'
-    ws['C7'].font = Font(bold=True)
+    ws['C7'].style = 'money_bold'
     ws['D7'] = '=D6'
-    ws['D7'].number_format = '#,##0.00'
-    ws['D7'].font = Font(bold=True)
+    ws['D7'].style = 'money_bold'
     
     # COST OF SERVICES
     ws['A9'] = "COST OF SERVICES"
-    ws['A9'].font = Font(bold=True, size=12, color="FFFFFF")
-    ws['A9'].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    ws['A9'].font = SECTION_FONT
+    ws['A9'].fill = SECTION_FILL
     ws.merge_cells('A9:B9')
     
     ws['A10'] = "Equipment Costs"
-    ws['C10'] = f'=SUMIFS(Expenses!E:E,Expenses!B:B,"Equipment Purchase",Expenses!A:A,">="&DATE(YEAR(TODAY()),MONTH(TODAY()),1))'
-    ws['C10'].number_format = '#,##0.00'
-    ws['D10'] = f'=SUMIFS(Expenses!E:E,Expenses!B:B,"Equipment Purchase",Expenses!A:A,">="&Settings!$B$14)'
-    ws['D10'].number_format = '#,##0.00'
+    add_category_rows(ws, [COST_OF_SERVICES_CATEGORY], 10,
+                      ((3, CATEGORY_MONTH_FORMULA), (4, CATEGORY_YTD_FORMULA)), label=False)
     
     ws['A11'] = "Total Cost of Services"
-    ws['A11'].font = Font(bold=True)
+    ws['A11'].font = BOLD_FONT
     ws['C11'] = '=C10'
-    ws['C11'].number_format = '#,##0.00'
-    ws['C11'].font = Font(bold=True)
+    ws['C11'].style = 'money_bold'
     ws['D11'] = '=D10'
-    ws['D11'].number_format = '#,##0.00'
-    ws['D11'].font = Font(bold=True)
+    ws['D11'].style = 'money_bold'
     
     # GROSS PROFIT
     ws['A13'] = "GROSS PROFIT"
-    ws['A13'].font = Font(bold=True, size=13)
+    ws['A13'].font = TOTAL_FONT
     ws['C13'] = '=C7-C11'
-    ws['C13'].number_format = '#,##0.00'
-    ws['C13'].font = Font(bold=True, size=12)
-    ws['C13'].fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+    ws['C13'].style = 'money'
+    ws['C13'].font = SUMMARY_TITLE_FONT
+    ws['C13'].fill = SUBTOTAL_FILL
     ws['D13'] = '=D7-D11'
-    ws['D13'].number_format = '#,##0.00'
-    ws['D13'].font = Font(bold=True, size=12)
-    ws['D13'].fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+    ws['D13'].style = 'money'
+    ws['D13'].font = SUMMARY_TITLE_FONT
+    ws['D13'].fill = SUBTOTAL_FILL
     
     # OPERATING EXPENSES
     ws['A15'] = "OPERATING EXPENSES"
-    ws['A15'].font = Font(bold=True, size=12, color="FFFFFF")
-    ws['A15'].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    ws['A15'].font = SECTION_FONT
+    ws['A15'].fill = SECTION_FILL
     ws.merge_cells('A15:B15')
     
-    expense_categories = [
-        "Equipment Maintenance", "Transport/Fuel", "Salaries/Wages", "Rent",
-        "Utilities", "Insurance", "Marketing", "Office Supplies",
-        "Professional Fees", "Bank Charges", "Other"
-    ]
-    
     start_row = 16
-    for idx, cat in enumerate(expense_categories, start=start_row):
-        ws[f'A{idx}'] = cat
-        ws[f'C{idx}'] = f'=SUMIFS(Expenses!E:E,Expenses!B:B,A{idx},Expenses!A:A,">="&DATE(YEAR(TODAY()),MONTH(TODAY()),1))'
-        ws[f'C{idx}'].number_format = '#,##0.00'
-        ws[f'D{idx}'] = f'=SUMIFS(Expenses!E:E,Expenses!B:B,A{idx},Expenses!A:A,">="&Settings!$B$14)'
-        ws[f'D{idx}'].number_format = '#,##0.00'
+    add_category_rows(ws, OPERATING_EXPENSE_CATEGORIES, start_row,
+                      ((3, CATEGORY_MONTH_FORMULA), (4, CATEGORY_YTD_FORMULA)))
     
-    total_row = start_row + len(expense_categories)
+    total_row = start_row + len(OPERATING_EXPENSE_CATEGORIES)
     ws[f'A{total_row}'] = "Total Operating Expenses"
-    ws[f'A{total_row}'].font = Font(bold=True)
+    ws[f'A{total_row}'].font = BOLD_FONT
     ws[f'C{total_row}'] = f'=SUM(C{start_row}:C{total_row-1})'
-    ws[f'C{total_row}'].number_format = '#,##0.00'
-    ws[f'C{total_row}'].font = Font(bold=True)
+    ws[f'C{total_row}'].style = 'money_bold'
     ws[f'D{total_row}'] = f'=SUM(D{start_row}:D{total_row-1})'
-    ws[f'D{total_row}'].number_format = '#,##0.00'
-    ws[f'D{total_row}'].font = Font(bold=True)
+    ws[f'D{total_row}'].style = 'money_bold'
     
     # NET INCOME
     net_row = total_row + 2
     ws[f'A{net_row}'] = "NET INCOME (LOSS)"
-    ws[f'A{net_row}'].font = Font(bold=True, size=14)
+    ws[f'A{net_row}'].font = HEADING_FONT
     ws[f'C{net_row}'] = f'=C13-C{total_row}'
-    ws[f'C{net_row}'].number_format = '#,##0.00'
-    ws[f'C{net_row}'].font = Font(bold=True, size=13)
-    ws[f'C{net_row}'].fill = PatternFill(start_color="92D050", end_color="92D050", fill_type="solid")
+    ws[f'C{net_row}'].style = 'money'
+    ws[f'C{net_row}'].font = TOTAL_FONT
+    ws[f'C{net_row}'].fill = PROFIT_FILL
     ws[f'D{net_row}'] = f'=D13-D{total_row}'
-    ws[f'D{net_row}'].number_format = '#,##0.00'
-    ws[f'D{net_row}'].font = Font(bold=True, size=13)
-    ws[f'D{net_row}'].fill = PatternFill(start_color="92D050", end_color="92D050", fill_type="solid")
+    ws[f'D{net_row}'].style = 'money'
+    ws[f'D{net_row}'].font = TOTAL_FONT
+    ws[f'D{net_row}'].fill = PROFIT_FILL
     
     # Profit Margin
     margin_row = net_row + 1
     ws[f'A{margin_row}'] = "Net Profit Margin"
-    ws[f'A{margin_row}'].font = Font(bold=True)
+    ws[f'A{margin_row}'].font = BOLD_FONT
     ws[f'C{margin_row}'] = f'=IF(C7=0,0,C{net_row}/C7)'
-    ws[f'C{margin_row}'].number_format = '0.00%'
+    ws[f'C{margin_row}'].style = 'pct'
     ws[f'D{margin_row}'] = f'=IF(D7=0,0,D{net_row}/D7)'
-    ws[f'D{margin_row}'].number_format = '0.00%'
+    ws[f'D{margin_row}'].style = 'pct'
     
-    # Set column widths
-    ws.column_dimensions['A'].width = 30
-    ws.column_dimensions['B'].width = 5
-    ws.column_dimensions['C'].width = 18
-    ws.column_dimensions['D'].width = 18
+    # Set column widths; rows added by hand default to the money format
+    set_column_widths(ws, [30, 5, 18, 18], number_formats={'C': MONEY_FORMAT, 'D': MONEY_FORMAT})
+    
+    return ws
 
 
-def create_balance_sheet_sheet(wb):
+def create_balance_sheet_sheet(wb, now):
     """Create professional Balance Sheet like QuickBooks"""
     ws = wb.create_sheet("Balance Sheet")
     
     # Title
     ws['A1'] = "BALANCE SHEET"
-    ws['A1'].font = Font(bold=True, size=16, color="FFFFFF")
-    ws['A1'].fill = PatternFill(start_color="203864", end_color="203864", fill_type="solid")
-    ws['A1'].alignment = Alignment(horizontal="center")
+    ws['A1'].font = REPORT_TITLE_FONT
+    ws['A1'].fill = TITLE_FILL
+    ws['A1'].alignment = CENTER_ALIGNMENT
     ws.merge_cells('A1:C1')
     
-    ws['A2'] = f"As at: {datetime.now().strftime('%B %d, %Y')}"
-    ws['A2'].alignment = Alignment(horizontal="center")
+    ws['A2'] = '="As at: "&TEXT(ReportDate,"MMMM DD, YYYY")'
+    ws['A2'].alignment = CENTER_ALIGNMENT
     ws.merge_cells('A2:C2')
     
     # ASSETS
     ws['A4'] = "ASSETS"
-    ws['A4'].font = Font(bold=True, size=14, color="FFFFFF")
-    ws['A4'].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    ws['A4'].font = TITLE_FONT
+    ws['A4'].fill = SECTION_FILL
     ws.merge_cells('A4:B4')
     
     ws['A5'] = "Current Assets"
-    ws['A5'].font = Font(bold=True, size=12)
-    
-    ws['A6'] = "  Cash in Hand"
-    ws['C6'] = "='Cash Position'!B8"
-    ws['C6'].number_format = '#,##0.00'
-    
-    ws['A7'] = "  Cash at Bank"
-    ws['C7'] = "='Cash Position'!B14"
-    ws['C7'].number_format = '#,##0.00'
+    ws['A5'].font = SUMMARY_TITLE_FONT
     
-    ws['A8'] = "  Accounts Receivable"
-    ws['C8'] = "='Trade Debtors'!J3"
-    ws['C8'].number_format = '#,##0.00'
+    add_value_rows(ws, (
+        (6, "  Cash in Hand", "=CashInHand"),
+        (7, "  Cash at Bank", "=CashAtBank"),
+        (8, "  Accounts Receivable", "=Receivables"),
+    ), value_col=3)
     
     ws['A9'] = "Total Current Assets"
-    ws['A9'].font = Font(bold=True)
+    ws['A9'].font = BOLD_FONT
     ws['C9'] = '=SUM(C6:C8)'
-    ws['C9'].number_format = '#,##0.00'
-    ws['C9'].font = Font(bold=True)
-    ws['C9'].fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
+    ws['C9'].style = 'money_total'
     
     ws['A11'] = "Fixed Assets"
-    ws['A11'].font = Font(bold=True, size=12)
+    ws['A11'].font = SUMMARY_TITLE_FONT
     
-    ws['A12'] = "  Equipment & Inventory"
-    ws['C12'] = '=Inventory!H12'
-    ws['C12'].number_format = '#,##0.00'
+    add_value_rows(ws, ((12, "  Equipment & Inventory", '=StockValue'),), value_col=3)
     
     ws['A13'] = "Total Fixed Assets"
-    ws['A13'].font = Font(bold=True)
+    ws['A13'].font = BOLD_FONT
     ws['C13'] = '=C12'
-    ws['C13'].number_format = '#,##0.00'
-    ws['C13'].font = Font(bold=True)
-    ws['C13'].fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
+    ws['C13'].style = 'money_total'
     
     ws['A15'] = "TOTAL ASSETS"
-    ws['A15'].font = Font(bold=True, size=13)
+    ws['A15'].font = TOTAL_FONT
     ws['C15'] = '=C9+C13'
-    ws['C15'].number_format = '#,##0.00'
-    ws['C15'].font = Font(bold=True, size=13)
-    ws['C15'].fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+    ws['C15'].style = 'money'
+    ws['C15'].font = TOTAL_FONT
+    ws['C15'].fill = SUBTOTAL_FILL
     
     # LIABILITIES & EQUITY
     ws['A17'] = "LIABILITIES & EQUITY"
-    ws['A17'].font = Font(bold=True, size=14, color="FFFFFF")
-    ws['A17'].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    ws['A17'].font = TITLE_FONT
+    ws['A17'].fill = SECTION_FILL
     ws.merge_cells('A17:B17')
     
     ws['A18'] = "Current Liabilities"
-    ws['A18'].font = Font(bold=True, size=12)
+    ws['A18'].font = SUMMARY_TITLE_FONT
     
-    ws['A19'] = "  Accounts Payable"
-    ws['C19'] = 0  # Can be enhanced with payables tracking
-    ws['C19'].number_format = '#,##0.00'
-    
-    ws['A20'] = "  VAT Payable"
-    ws['C20'] = "='Tax Summary'!B12"
-    ws['C20'].number_format = '#,##0.00'
+    add_value_rows(ws, (
+        (19, "  Accounts Payable", 0),  # Can be enhanced with payables tracking
+        (20, "  VAT Payable", "='Tax Summary'!B12"),
+    ), value_col=3)
     
     ws['A21'] = "Total Current Liabilities"
-    ws['A21'].font = Font(bold=True)
+    ws['A21'].font = BOLD_FONT
     ws['C21'] = '=SUM(C19:C20)'
-    ws['C21'].number_format = '#,##0.00'
-    ws['C21'].font = Font(bold=True)
-    ws['C21'].fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
+    ws['C21'].style = 'money_total'
     
     ws['A23'] = "Owner's Equity"
-    ws['A23'].font = Font(bold=True, size=12)
-    
-    ws['A24'] = "  Opening Capital"
-    ws['C24'] = '=Settings!B17+Settings!B18'  # Opening balances
-    ws['C24'].number_format = '#,##0.00'
+    ws['A23'].font = SUMMARY_TITLE_FONT
     
-    ws['A25'] = "  Retained Earnings (YTD)"
-    ws['C25'] = "='Profit & Loss'!D29"  # Net income
-    ws['C25'].number_format = '#,##0.00'
+    add_value_rows(ws, (
+        (24, "  Opening Capital", '=OpeningCash+OpeningBank'),
+        (25, "  Retained Earnings (YTD)", "='Profit & Loss'!D29"),  # Net income
+    ), value_col=3)
+    set_cached_values(ws, C24=OPENING_CASH + OPENING_BANK)
     
     ws['A26'] = "Total Owner's Equity"
-    ws['A26'].font = Font(bold=True)
+    ws['A26'].font = BOLD_FONT
     ws['C26'] = '=C24+C25'
-    ws['C26'].number_format = '#,##0.00'
-    ws['C26'].font = Font(bold=True)
-    ws['C26'].fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
+    ws['C26'].style = 'money_total'
     
     ws['A28'] = "TOTAL LIABILITIES & EQUITY"
-    ws['A28'].font = Font(bold=True, size=13)
+    ws['A28'].font = TOTAL_FONT
     ws['C28'] = '=C21+C26'
-    ws['C28'].number_format = '#,##0.00'
-    ws['C28'].font = Font(bold=True, size=13)
-    ws['C28'].fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+    ws['C28'].style = 'money'
+    ws['C28'].font = TOTAL_FONT
+    ws['C28'].fill = SUBTOTAL_FILL
     
     # Balance Check
     ws['A30'] = "CHECK (Should be zero):"
-    ws['A30'].font = Font(bold=True, italic=True)
+    ws['A30'].font = BOLD_ITALIC_FONT
     ws['C30'] = '=C15-C28'
-    ws['C30'].number_format = '#,##0.00'
-    ws['C30'].font = Font(bold=True)
+    ws['C30'].style = 'money_bold'
     
     # Conditional formatting for balance check
-    ws.conditional_formatting.add('C30:C30',
-        CellIsRule(operator='equal', formula=['0'], 
-                   stopIfTrue=True, 
-                   fill=PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")))
-    
-    ws.conditional_formatting.add('C30:C30',
-        CellIsRule(operator='notEqual', formula=['0'], 
-                   stopIfTrue=True, 
-                   fill=PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")))
+    add_zero_check_formatting(ws, 'C30:C30')
     
     # Set column widths
-    ws.column_dimensions['A'].width = 35
-    ws.column_dimensions['B'].width = 5
-    ws.column_dimensions['C'].width = 20
+    set_column_widths(ws, [35, 5, 20])
+    
+    return ws
 
 
-def create_tax_summary_sheet(wb):
+def create_tax_summary_sheet(wb, now):
     """Create Tax Summary sheet for end-of-year reporting"""
     ws = wb.create_sheet("Tax Summary")
     
     # Title
     ws['A1'] = "END-OF-YEAR TAX SUMMARY"
-    ws['A1'].font = Font(bold=True, size=14)
+    ws['A1'].font = HEADING_FONT
     ws.merge_cells('A1:D1')
     
     ws['A2'] = "Financial Year: 2025"
-    ws['A2'].font = Font(size=11)
+    ws['A2'].font = BODY_FONT
     ws.merge_cells('A2:D2')
     
     # Revenue Section
     ws['A4'] = "REVENUE"
-    ws['A4'].font = Font(bold=True, size=12, color="FFFFFF")
-    ws['A4'].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    ws['A4'].font = SECTION_FONT
+    ws['A4'].fill = SECTION_FILL
     ws.merge_cells('A4:B4')
     
-    ws['A5'] = "Total Revenue (Invoiced)"
-    ws['B5'] = '=SUMIFS(Revenue!G:G,Revenue!A:A,">="&Settings!$B$14,Revenue!A:A,"<"&DATE(YEAR(Settings!$B$14)+1,1,1))'
-    ws['B5'].number_format = '#,##0.00'
-    
-    ws['A6'] = "Total Revenue (Received)"
-    ws['B6'] = '=SUMIFS(Revenue!H:H,Revenue!A:A,">="&Settings!$B$14,Revenue!A:A,"<"&DATE(YEAR(Settings!$B$14)+1,1,1))'
-    ws['B6'].number_format = '#,##0.00'
-    
-    ws['A7'] = "Outstanding Receivables"
-    ws['B7'] = "=B5-B6"
-    ws['B7'].number_format = '#,##0.00'
+    dates = f"{REVENUE_TABLE}[Date]"
+    add_value_rows(ws, (
+        (5, "Total Revenue (Invoiced)", f'=SUMIFS({REVENUE_TABLE}[Total Amount],{dates},">="&FYStart,{dates},"<"&DATE(YEAR(FYStart)+1,1,1))'),
+        (6, "Total Revenue (Received)", f'=SUMIFS({REVENUE_TABLE}[Amount Received],{dates},">="&FYStart,{dates},"<"&DATE(YEAR(FYStart)+1,1,1))'),
+        (7, "Outstanding Receivables", "=B5-B6"),
+    ))
     
     # VAT Section
     ws['A9'] = "VALUE ADDED TAX (VAT)"
-    ws['A9'].font = Font(bold=True, size=12, color="FFFFFF")
-    ws['A9'].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    ws['A9'].font = SECTION_FONT
+    ws['A9'].fill = SECTION_FILL
     ws.merge_cells('A9:B9')
     
-    ws['A10'] = "VAT Collected on Sales"
-    ws['B10'] = '=SUMIFS(Invoices!J:J,Invoices!B:B,">="&Settings!$B$14,Invoices!B:B,"<"&DATE(YEAR(Settings!$B$14)+1,1,1))'
-    ws['B10'].number_format = '#,##0.00'
-    
-    ws['A11'] = "VAT Paid on Purchases"
-    ws['B11'] = '=SUMIFS(Expenses!E:E,Expenses!A:A,">="&Settings!$B$14,Expenses!A:A,"<"&DATE(YEAR(Settings!$B$14)+1,1,1))*(Settings!$B$13/100)/(1+Settings!$B$13/100)'
-    ws['B11'].number_format = '#,##0.00'
+    add_value_rows(ws, (
+        (10, "VAT Collected on Sales", f'=SUMIFS({data_range("J", "Invoices")},{data_range("B", "Invoices")},">="&FYStart,'
+                                     f'{data_range("B", "Invoices")},"<"&DATE(YEAR(FYStart)+1,1,1))'),
+        (11, "VAT Paid on Purchases",
+         f'=SUMIFS({EXPENSES_TABLE}[Amount],{EXPENSES_TABLE}[Date],">="&FYStart,'
+         f'{EXPENSES_TABLE}[Date],"<"&DATE(YEAR(FYStart)+1,1,1))*(VATRate/100)/(1+VATRate/100)'),
+    ))
     
     ws['A12'] = "Net VAT Payable"
     ws['B12'] = "=B10-B11"
-    ws['B12'].number_format = '#,##0.00'
-    ws['B12'].font = Font(bold=True)
-    ws['B12'].fill = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
+    ws['B12'].style = 'money_highlight'
     
     # Expenses Section
     ws['A14'] = "EXPENSES (Deductible)"
-    ws['A14'].font = Font(bold=True, size=12, color="FFFFFF")
-    ws['A14'].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    ws['A14'].font = SECTION_FONT
+    ws['A14'].fill = SECTION_FILL
     ws.merge_cells('A14:B14')
     
-    categories = [
-        "Equipment Purchase", "Equipment Maintenance", "Transport/Fuel",
-        "Salaries/Wages", "Rent", "Utilities", "Insurance", "Marketing",
-        "Office Supplies", "Professional Fees", "Bank Charges", "Other"
-    ]
-    
     start_row = 15
-    for idx, cat in enumerate(categories, start=start_row):
-        ws[f'A{idx}'] = cat
-        ws[f'B{idx}'] = f'=SUMIFS(Expenses!E:E,Expenses!B:B,A{idx},Expenses!A:A,">="&Settings!$B$14,Expenses!A:A,"<"&DATE(YEAR(Settings!$B$14)+1,1,1))'
-        ws[f'B{idx}'].number_format = '#,##0.00'
+    add_category_rows(ws, EXPENSE_CATEGORIES, start_row, ((2, CATEGORY_FY_FORMULA),))
     
-    total_row = start_row + len(categories)
+    total_row = start_row + len(EXPENSE_CATEGORIES)
     ws[f'A{total_row}'] = "Total Expenses"
-    ws[f'A{total_row}'].font = Font(bold=True)
+    ws[f'A{total_row}'].font = BOLD_FONT
     ws[f'B{total_row}'] = f'=SUM(B{start_row}:B{total_row-1})'
-    ws[f'B{total_row}'].number_format = '#,##0.00'
-    ws[f'B{total_row}'].font = Font(bold=True)
-    ws[f'B{total_row}'].fill = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
+    ws[f'B{total_row}'].style = 'money_highlight'
     
     # Net Profit Section
     profit_row = total_row + 2
     ws[f'A{profit_row}'] = "NET PROFIT BEFORE TAX"
-    ws[f'A{profit_row}'].font = Font(bold=True, size=13)
+    ws[f'A{profit_row}'].font = TOTAL_FONT
     ws[f'B{profit_row}'] = f'=B6-B{total_row}'
-    ws[f'B{profit_row}'].number_format = '#,##0.00'
-    ws[f'B{profit_row}'].font = Font(bold=True, size=13)
-    ws[f'B{profit_row}'].fill = PatternFill(start_color="92D050", end_color="92D050", fill_type="solid")
+    ws[f'B{profit_row}'].style = 'money'
+    ws[f'B{profit_row}'].font = TOTAL_FONT
+    ws[f'B{profit_row}'].fill = PROFIT_FILL
     
     # Profit Margin
     margin_row = profit_row + 1
     ws[f'A{margin_row}'] = "Profit Margin (%)"
     ws[f'B{margin_row}'] = f'=IF(B6=0,0,B{profit_row}/B6)'
-    ws[f'B{margin_row}'].number_format = '0.00%'
-    ws[f'B{margin_row}'].font = Font(bold=True)
+    ws[f'B{margin_row}'].style = 'pct'
+    ws[f'B{margin_row}'].font = BOLD_FONT
     
     # Set column widths
-    ws.column_dimensions['A'].width = 30
-    ws.column_dimensions['B'].width = 20
+    set_column_widths(ws, [30, 20], number_formats={'B': MONEY_FORMAT})
+    
+    return ws
 
 
-def create_invoice_template_sheet(wb):
+def create_invoice_template_sheet(wb, now):
     """Create printable Invoice Template sheet like QuickBooks"""
     ws = wb.create_sheet("Invoice Template")
     
@@ -1347,65 +1423,62 @@ def create_invoice_template_sheet(wb):
     
     # Company Name
     ws[f'{text_col}1'] = COMPANY_NAME
-    ws[f'{text_col}1'].font = Font(bold=True, size=20, color=BRAND_COLOR_PRIMARY)
+    ws[f'{text_col}1'].font = INVOICE_COMPANY_FONT
     if not logo_added:
         ws.merge_cells('A1:C1')
     
     # Tagline
     ws[f'{text_col}2'] = COMPANY_TAGLINE
-    ws[f'{text_col}2'].font = Font(size=11, italic=True, color="666666")
+    ws[f'{text_col}2'].font = INVOICE_TAGLINE_FONT
     if not logo_added:
         ws.merge_cells('A2:C2')
     
     # Contact Information
-    ws[f'{text_col}3'] = f"{COMPANY_PHONE} | {COMPANY_EMAIL}"
-    ws[f'{text_col}3'].font = Font(size=9, color="666666")
+    ws[f'{text_col}3'] = CONTACT_LINE
+    ws[f'{text_col}3'].font = CONTACT_FONT
     if not logo_added:
         ws.merge_cells('A3:C3')
     
-    ws[f'{text_col}4'] = f"{COMPANY_ADDRESS} | {COMPANY_WEBSITE}"
-    ws[f'{text_col}4'].font = Font(size=9, color="666666")
+    ws[f'{text_col}4'] = ADDRESS_LINE
+    ws[f'{text_col}4'].font = CONTACT_FONT
     if not logo_added:
         ws.merge_cells('A4:C4')
     
     # Invoice Title
-    ws['E1'] = "INVOICE"
-    ws['E1'].font = Font(bold=True, size=24, color="FFFFFF")
-    ws['E1'].fill = PatternFill(start_color="203864", end_color="203864", fill_type="solid")
-    ws['E1'].alignment = Alignment(horizontal="center", vertical="center")
-    ws.merge_cells('E1:F2')
+    add_band(ws, 'E1:F2', "INVOICE", INVOICE_TITLE_FONT,
+             TITLE_FILL, MIDDLE_ALIGNMENT)
     
     # Invoice Details Section
     ws['A5'] = "BILL TO:"
-    ws['A5'].font = Font(bold=True, size=11)
+    ws['A5'].font = BOLD_FONT
     
     ws['A6'] = "Client Name:"
     ws['B6'] = "[Select from Invoices sheet]"
-    ws['B6'].font = Font(italic=True, color="666666")
+    ws['B6'].font = NOTE_FONT
     
     ws['A7'] = "Address:"
     ws['B7'] = "[Auto-filled from Customers]"
-    ws['B7'].font = Font(italic=True, color="666666")
+    ws['B7'].font = NOTE_FONT
     
     ws['A8'] = "Phone:"
     ws['B8'] = "[Auto-filled from Customers]"
-    ws['B8'].font = Font(italic=True, color="666666")
+    ws['B8'].font = NOTE_FONT
     
     # Invoice Meta
     ws['E5'] = "Invoice No:"
-    ws['E5'].font = Font(bold=True)
+    ws['E5'].font = BOLD_FONT
     ws['F5'] = "INV-2025-001"
-    ws['F5'].fill = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
+    ws['F5'].fill = HIGHLIGHT_FILL
     
     ws['E6'] = "Invoice Date:"
-    ws['E6'].font = Font(bold=True)
-    ws['F6'] = datetime.now()
-    ws['F6'].number_format = 'YYYY-MM-DD'
+    ws['E6'].font = BOLD_FONT
+    ws['F6'] = now
+    ws['F6'].style = 'ymd'
     
     ws['E7'] = "Due Date:"
-    ws['E7'].font = Font(bold=True)
-    ws['F7'] = datetime.now()
-    ws['F7'].number_format = 'YYYY-MM-DD'
+    ws['E7'].font = BOLD_FONT
+    ws['F7'] = now
+    ws['F7'].style = 'ymd'
     
     # Items Table
     ws['A10'] = "Description"
@@ -1418,42 +1491,40 @@ def create_invoice_template_sheet(wb):
     ws['A11'] = "LED Stage Lights"
     ws['B11'] = 10
     ws['C11'] = 1200
-    ws['C11'].number_format = '#,##0.00'
+    ws['C11'].style = 'money'
     ws['D11'] = "=B11*C11"
-    ws['D11'].number_format = '#,##0.00'
+    ws['D11'].style = 'money'
     
     ws['A12'] = "Sound System Setup"
     ws['B12'] = 1
     ws['C12'] = 5000
-    ws['C12'].number_format = '#,##0.00'
+    ws['C12'].style = 'money'
     ws['D12'] = "=B12*C12"
-    ws['D12'].number_format = '#,##0.00'
+    ws['D12'].style = 'money'
     
     # Totals Section
     ws['C17'] = "Subtotal:"
-    ws['C17'].font = Font(bold=True)
-    ws['C17'].alignment = Alignment(horizontal="right")
+    ws['C17'].font = BOLD_FONT
+    ws['C17'].alignment = RIGHT_ALIGNMENT
     ws['D17'] = '=SUM(D11:D16)'
-    ws['D17'].number_format = '#,##0.00'
-    ws['D17'].font = Font(bold=True)
+    ws['D17'].style = 'money_bold'
     
     ws['C18'] = "VAT (15%):"
-    ws['C18'].alignment = Alignment(horizontal="right")
-    ws['D18'] = '=D17*Settings!B4/100'
-    ws['D18'].number_format = '#,##0.00'
+    ws['C18'].alignment = RIGHT_ALIGNMENT
+    ws['D18'] = '=D17*VATRate/100'
+    ws['D18'].style = 'money'
     
     ws['C19'] = "TOTAL:"
-    ws['C19'].font = Font(bold=True, size=13)
-    ws['C19'].alignment = Alignment(horizontal="right")
+    ws['C19'].font = TOTAL_FONT
+    ws['C19'].alignment = RIGHT_ALIGNMENT
     ws['D19'] = '=D17+D18'
-    ws['D19'].number_format = '#,##0.00'
-    ws['D19'].font = Font(bold=True, size=13)
-    ws['D19'].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    ws['D19'].font = Font(bold=True, size=13, color="FFFFFF")
+    ws['D19'].style = 'money'
+    ws['D19'].font = LARGE_SECTION_FONT
+    ws['D19'].fill = SECTION_FILL
     
     # Payment Info
     ws['A21'] = "PAYMENT INFORMATION"
-    ws['A21'].font = Font(bold=True, size=11)
+    ws['A21'].font = BOLD_FONT
     apply_header_style(ws, 21, 1, 2)
     
     ws['A22'] = "Bank: Sample Bank"
@@ -1461,38 +1532,33 @@ def create_invoice_template_sheet(wb):
     ws['A24'] = "Account Number: 0123456789"
     
     # Footer
-    ws['A26'] = "Thank you for your business!"
-    ws['A26'].font = Font(italic=True, size=10)
-    ws['A26'].alignment = Alignment(horizontal="center")
-    ws.merge_cells('A26:D26')
+    add_band(ws, 'A26:D26', "Thank you for your business!", CAPTION_FONT,
+             alignment=CENTER_ALIGNMENT)
     
     # Set column widths
-    ws.column_dimensions['A'].width = 30
-    ws.column_dimensions['B'].width = 12
-    ws.column_dimensions['C'].width = 15
-    ws.column_dimensions['D'].width = 18
-    ws.column_dimensions['E'].width = 15
-    ws.column_dimensions['F'].width = 18
+    set_column_widths(ws, [30, 12, 15, 18, 15, 18])
     
     # Set print area
     ws.print_area = 'A1:F26'
+    
+    return ws
 
 
-def create_audit_log_sheet(wb):
+def create_audit_log_sheet(wb, now):
     """Create Audit Log sheet for tracking changes"""
     ws = wb.create_sheet("Audit Log")
     
     # Title
     ws['A1'] = "AUDIT LOG - TRANSACTION HISTORY"
-    ws['A1'].font = Font(bold=True, size=14, color="FFFFFF")
-    ws['A1'].fill = PatternFill(start_color="C00000", end_color="C00000", fill_type="solid")
-    ws['A1'].alignment = Alignment(horizontal="center")
+    ws['A1'].font = TITLE_FONT
+    ws['A1'].fill = AUDIT_FILL
+    ws['A1'].alignment = CENTER_ALIGNMENT
     ws.merge_cells('A1:F1')
     
     ws['A2'] = "This sheet tracks all financial transactions for audit purposes"
-    ws['A2'].font = Font(italic=True, size=10)
+    ws['A2'].font = CAPTION_FONT
     ws.merge_cells('A2:F2')
-    ws['A2'].alignment = Alignment(horizontal="center")
+    ws['A2'].alignment = CENTER_ALIGNMENT
     
     # Headers
     headers = [
@@ -1506,249 +1572,266 @@ def create_audit_log_sheet(wb):
     apply_header_style(ws, 4, 1, len(headers))
     
     # Sample audit entries
-    ws['A5'] = datetime.now()
-    ws['A5'].number_format = 'YYYY-MM-DD HH:MM:SS'
-    ws['B5'] = "Invoices"
-    ws['C5'] = "New Invoice Created"
-    ws['D5'] = "INV-2025-001"
-    ws['E5'] = 17250
-    ws['E5'].number_format = '#,##0.00'
-    ws['F5'] = "Sample Client Ltd - Event lighting setup"
-    
-    ws['A6'] = datetime.now()
-    ws['A6'].number_format = 'YYYY-MM-DD HH:MM:SS'
-    ws['B6'] = "Expenses"
-    ws['C6'] = "New Expense Recorded"
-    ws['D6'] = "TXN-001"
-    ws['E6'] = 25000
-    ws['E6'].number_format = '#,##0.00'
-    ws['F6'] = "Equipment Purchase - Tech Supplies Ltd"
+    sample_entries = [
+        [now, "Invoices", "New Invoice Created", "INV-2025-001", 17250,
+         "Sample Client Ltd - Event lighting setup"],
+        [now, "Expenses", "New Expense Recorded", "TXN-001", 25000,
+         "Equipment Purchase - Tech Supplies Ltd"],
+    ]
+    for entry in sample_entries:
+        ws.append(entry)
+        ws.cell(row=ws.max_row, column=1).number_format = TIMESTAMP_FORMAT
+        ws.cell(row=ws.max_row, column=5).style = 'money'
     
     # Instructions
     ws['A8'] = "Note: This log should be updated whenever financial transactions are created or modified."
-    ws['A8'].font = Font(italic=True, size=9, color="666666")
+    ws['A8'].font = FOOTNOTE_FONT
     ws.merge_cells('A8:F8')
     
-    # Set column widths
-    widths = [20, 15, 25, 18, 15, 50]
-    for idx, width in enumerate(widths, start=1):
-        ws.column_dimensions[get_column_letter(idx)].width = width
+    # Set column widths; entries typed below the samples pick up the formats
+    set_column_widths(ws, [20, 15, 25, 18, 15, 50],
+                      number_formats={'A': TIMESTAMP_FORMAT, 'E': MONEY_FORMAT})
     
     ws.freeze_panes = 'A5'
+    
+    return ws
 
 
-def create_dashboard_sheet(wb):
+def create_dashboard_sheet(wb, now):
     """Create Business Health Dashboard"""
     ws = wb.create_sheet("Dashboard")
     
     # Add company logo and branding
     logo_added = add_logo_to_sheet(ws, 'A1')
     
-    # Title - adjust position if logo was added
-    title_start = 'C1' if logo_added else 'A1'
-    title_merge = 'C1:F1' if logo_added else 'A1:F1'
-    
-    ws[title_start] = COMPANY_NAME
-    ws[title_start].font = Font(bold=True, size=18, color="FFFFFF")
-    ws[title_start].fill = PatternFill(start_color=BRAND_COLOR_PRIMARY, end_color=BRAND_COLOR_PRIMARY, fill_type="solid")
-    ws[title_start].alignment = Alignment(horizontal="center", vertical="center")
-    ws.merge_cells(title_merge)
-    
-    # Subtitle
-    subtitle_cell = 'C2' if logo_added else 'A2'
-    subtitle_merge = 'C2:F2' if logo_added else 'A2:F2'
-    
-    ws[subtitle_cell] = "BUSINESS HEALTH DASHBOARD"
-    ws[subtitle_cell].font = Font(bold=True, size=12, color="FFFFFF")
-    ws[subtitle_cell].fill = PatternFill(start_color=BRAND_COLOR_SECONDARY, end_color=BRAND_COLOR_SECONDARY, fill_type="solid")
-    ws[subtitle_cell].alignment = Alignment(horizontal="center")
-    ws.merge_cells(subtitle_merge)
+    # Title, subtitle and timestamp bands - leave room for the logo if added
+    band_col = 'C' if logo_added else 'A'
     
-    # Updated timestamp
-    update_cell = 'C3' if logo_added else 'A3'
-    update_merge = 'C3:F3' if logo_added else 'A3:F3'
-    
-    ws[update_cell] = f"Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-    ws[update_cell].alignment = Alignment(horizontal="center")
-    ws[update_cell].font = Font(size=9, italic=True)
-    ws.merge_cells(update_merge)
+    add_band(ws, f'{band_col}1:F1', COMPANY_NAME, DASHBOARD_TITLE_FONT,
+             TITLE_FILL, MIDDLE_ALIGNMENT)
+    add_band(ws, f'{band_col}2:F2', "BUSINESS HEALTH DASHBOARD", SECTION_FONT,
+             SECTION_FILL, CENTER_ALIGNMENT)
+    add_band(ws, f'{band_col}3:F3', '="Updated: "&TEXT(NOW(),"YYYY-MM-DD HH:MM")',
+             TIMESTAMP_FONT, alignment=CENTER_ALIGNMENT)
     
     # Key Metrics Section
-    ws['A4'] = "KEY FINANCIAL METRICS"
-    ws['A4'].font = Font(bold=True, size=13)
-    ws.merge_cells('A4:F4')
-    
-    # Metric cards
-    metrics = [
-        ("Monthly Revenue", '=Revenue!L4', 'A6', 'B6'),
-        ("Monthly Expenses", '=Expenses!J3', 'A7', 'B7'),
-        ("Monthly Net Profit", '=B6-B7', 'A8', 'B8'),
-        ("Profit Margin", '=IF(B6=0,0,B8/B6)', 'A9', 'B9'),
-        ("", "", "", ""),
-        ("YTD Revenue", '=Revenue!L5', 'A11', 'B11'),
-        ("YTD Expenses", '=Expenses!J4', 'A12', 'B12'),
-        ("YTD Net Profit", '=B11-B12', 'A13', 'B13'),
-        ("YTD Profit Margin", '=IF(B11=0,0,B13/B11)', 'A14', 'B14'),
+    add_band(ws, 'A4:F4', "KEY FINANCIAL METRICS", TOTAL_FONT)
+    
+    # Metric cards: each row holds a metric in A:B and a balance card in D:E
+    # (label, formula) or None for an empty half
+    card_rows = [
+        (("Monthly Revenue", '=Revenue!M4'), ("Cash in Hand", "=CashInHand")),
+        (("Monthly Expenses", '=Expenses!J3'), ("Cash at Bank", "=CashAtBank")),
+        (("Monthly Net Profit", '=B6-B7'), ("Total Cash", "=E6+E7")),
+        (("Profit Margin", '=IF(B6=0,0,B8/B6)'), None),
+        (None, ("Outstanding Invoices", "=Receivables")),
+        (("YTD Revenue", '=Revenue!M5'), ("Total Stock Value", "=StockValue")),
+        (("YTD Expenses", '=Expenses!J4'), ("VAT Payable", "='Tax Summary'!B12")),
+        (("YTD Net Profit", '=B11-B12'), None),
+        (("YTD Profit Margin", '=IF(B11=0,0,B13/B11)'), None),
     ]
-    
-    for metric_name, formula, label_cell, value_cell in metrics:
-        if metric_name:
-            ws[label_cell] = metric_name
-            ws[label_cell].font = Font(bold=True)
-            ws[value_cell] = formula
-            if "Margin" in metric_name:
-                ws[value_cell].number_format = '0.00%'
-            else:
-                ws[value_cell].number_format = '#,##0.00'
-            ws[value_cell].font = Font(bold=True, size=12)
-            ws[value_cell].fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-    
-    # Cash Position
-    ws['D6'] = "Cash in Hand"
-    ws['D6'].font = Font(bold=True)
-    ws['E6'] = "='Cash Position'!B8"
-    ws['E6'].number_format = '#,##0.00'
-    ws['E6'].fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-    
-    ws['D7'] = "Cash at Bank"
-    ws['D7'].font = Font(bold=True)
-    ws['E7'] = "='Cash Position'!B14"
-    ws['E7'].number_format = '#,##0.00'
-    ws['E7'].fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-    
-    ws['D8'] = "Total Cash"
-    ws['D8'].font = Font(bold=True)
-    ws['E8'] = "=E6+E7"
-    ws['E8'].number_format = '#,##0.00'
-    ws['E8'].font = Font(bold=True, size=12)
-    ws['E8'].fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-    
-    # Receivables and KPIs
-    ws['D10'] = "Outstanding Invoices"
-    ws['D10'].font = Font(bold=True)
-    ws['E10'] = "='Trade Debtors'!J3"
-    ws['E10'].number_format = '#,##0.00'
-    ws['E10'].fill = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
-    
-    ws['D11'] = "Total Stock Value"
-    ws['D11'].font = Font(bold=True)
-    ws['E11'] = "=Inventory!H12"
-    ws['E11'].number_format = '#,##0.00'
-    ws['E11'].fill = PatternFill(start_color="E2EFDA", end_color="E2EFDA", fill_type="solid")
-    
-    ws['D12'] = "VAT Payable"
-    ws['D12'].font = Font(bold=True)
-    ws['E12'] = "='Tax Summary'!B12"
-    ws['E12'].number_format = '#,##0.00'
-    ws['E12'].fill = PatternFill(start_color="FFE699", end_color="FFE699", fill_type="solid")
+    card_fills = {
+        "Cash in Hand": TOTAL_FILL,
+        "Cash at Bank": TOTAL_FILL,
+        "Total Cash": SUBTOTAL_FILL,
+        "Outstanding Invoices": HIGHLIGHT_FILL,
+        "Total Stock Value": STOCK_FILL,
+        "VAT Payable": TAX_FILL,
+    }
+    
+    ws.append([])  # row 5 left blank under the section band
+    for metric, card in card_rows:
+        ws.append([*(metric or (None, None)), None, *(card or (None, None))])
+        row = ws.max_row
+        if metric:
+            ws.cell(row=row, column=1).font = BOLD_FONT
+            value_cell = ws.cell(row=row, column=2)
+            value_cell.style = 'pct' if "Margin" in metric[0] else 'money'
+            value_cell.font = SUMMARY_TITLE_FONT
+            value_cell.fill = TOTAL_FILL
+        if card:
+            ws.cell(row=row, column=4).font = BOLD_FONT
+            value_cell = ws.cell(row=row, column=5)
+            value_cell.style = 'money'
+            if card[0] == "Total Cash":
+                value_cell.font = SUMMARY_TITLE_FONT
+            value_cell.fill = card_fills[card[0]]
     
     # Key Performance Indicators
-    ws['A16'] = "KEY PERFORMANCE INDICATORS (KPIs)"
-    ws['A16'].font = Font(bold=True, size=12)
-    ws.merge_cells('A16:F16')
-    
-    # Days Sales Outstanding (DSO)
-    ws['A17'] = "Days Sales Outstanding (DSO)"
-    ws['A17'].font = Font(bold=True)
-    ws['B17'] = '=IF(Revenue!L4=0,0,("Trade Debtors"!J3/(Revenue!L5/365)))'
-    ws['B17'].number_format = '0.0 "days"'
-    ws['B17'].fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-    
-    # Quick Ratio (Current Assets / Current Liabilities)
-    ws['A18'] = "Quick Ratio"
-    ws['A18'].font = Font(bold=True)
-    ws['B18'] = '=IF("Balance Sheet"!C21=0,0,"Balance Sheet"!C9/"Balance Sheet"!C21)'
-    ws['B18'].number_format = '0.00'
-    ws['B18'].fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
+    add_band(ws, 'A16:F16', "KEY PERFORMANCE INDICATORS (KPIs)", SUMMARY_TITLE_FONT)
+    
+    # KPI cells: (label cell, label, value cell, formula, named style)
+    for label_cell, label, value_cell, formula, style in (
+        ('A17', "Days Sales Outstanding (DSO)", 'B17',
+         "=IF(Revenue!M5=0,0,(Receivables/(Revenue!M5/365)))", 'kpi_days'),
+        # Quick Ratio (Current Assets / Current Liabilities)
+        ('A18', "Quick Ratio", 'B18',
+         "=IF('Balance Sheet'!C21=0,0,'Balance Sheet'!C9/'Balance Sheet'!C21)", 'kpi_ratio'),
+        # YTD gross profit over YTD revenue, from the P&L
+        ('D17', "Gross Profit Margin", 'E17',
+         "=IF('Profit & Loss'!D7=0,0,'Profit & Loss'!D13/'Profit & Loss'!D7)", 'kpi_pct'),
+        ('D18', "Total Assets", 'E18', "='Balance Sheet'!C15", 'kpi_money'),
+    ):
+        ws[label_cell] = label
+        ws[label_cell].font = BOLD_FONT
+        ws[value_cell] = formula
+        ws[value_cell].style = style
     
     # Conditional formatting for Quick Ratio (healthy > 1.0)
     ws.conditional_formatting.add('B18:B18',
         CellIsRule(operator='greaterThan', formula=['1'], 
                    stopIfTrue=True, 
-                   fill=PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")))
+                   fill=GOOD_FILL))
     
     ws.conditional_formatting.add('B18:B18',
         CellIsRule(operator='lessThan', formula=['1'], 
                    stopIfTrue=True, 
-                   fill=PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")))
-    
-    # Gross Profit Margin
-    ws['D17'] = "Gross Profit Margin"
-    ws['D17'].font = Font(bold=True)
-    ws['E17'] = '="Profit & Loss"!D30'
-    ws['E17'].number_format = '0.00%'
-    ws['E17'].fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-    
-    # Inventory Turnover
-    ws['D18'] = "Total Assets"
-    ws['D18'].font = Font(bold=True)
-    ws['E18'] = '="Balance Sheet"!C15'
-    ws['E18'].number_format = '#,##0.00'
-    ws['E18'].fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
+                   fill=BAD_FILL))
     
     # Revenue vs Expense Trend
-    ws['A20'] = "REVENUE VS EXPENSE TREND (Monthly)"
-    ws['A20'].font = Font(bold=True, size=12)
-    ws.merge_cells('A20:F20')
+    add_band(ws, 'A20:F20', "REVENUE VS EXPENSE TREND (Monthly)", SUMMARY_TITLE_FONT)
     
     ws['A21'] = "Month"
     ws['B21'] = "Revenue"
     ws['C21'] = "Expenses"
     ws['D21'] = "Net Profit"
-    apply_header_style(ws, 21, 1, 4)
-    
-    months = ["January", "February", "March", "April", "May", "June", 
-              "July", "August", "September", "October", "November", "December"]
-    
-    for idx, month in enumerate(months, start=22):
-        month_num = idx - 21
-        ws[f'A{idx}'] = month
-        ws[f'B{idx}'] = f'=SUMIFS(Revenue!H:H,Revenue!A:A,">="&DATE(YEAR(TODAY()),{month_num},1),Revenue!A:A,"<"&DATE(YEAR(TODAY()),{month_num}+1,1))'
-        ws[f'B{idx}'].number_format = '#,##0.00'
-        ws[f'C{idx}'] = f'=SUMIFS(Expenses!E:E,Expenses!A:A,">="&DATE(YEAR(TODAY()),{month_num},1),Expenses!A:A,"<"&DATE(YEAR(TODAY()),{month_num}+1,1))'
-        ws[f'C{idx}'].number_format = '#,##0.00'
-        ws[f'D{idx}'] = f'=B{idx}-C{idx}'
-        ws[f'D{idx}'].number_format = '#,##0.00'
-        
-        # Conditional formatting for profit/loss
-        ws.conditional_formatting.add(f'D{idx}:D{idx}',
-            CellIsRule(operator='greaterThan', formula=['0'], 
-                       stopIfTrue=True, 
-                       fill=PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")))
-        
-        ws.conditional_formatting.add(f'D{idx}:D{idx}',
-            CellIsRule(operator='lessThan', formula=['0'], 
-                       stopIfTrue=True, 
-                       fill=PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")))
+    header_row = 21
+    apply_header_style(ws, header_row, 1, 4)
+    
+    # The header is the last row written so far, so each month appends below it
+    for month_num in range(1, len(MONTHLY_FLOW_FORMULAS) + 1):
+        row, cash_row = header_row + month_num, FIRST_MONTH_ROW - 1 + month_num
+        ws.append([calendar.month_name[month_num], f"='Cash Position'!E{cash_row}",
+                   f"='Cash Position'!F{cash_row}", f'=B{row}-C{row}'])
+        for col in range(2, 5):
+            ws.cell(row=row, column=col).style = 'money'
+    
+    # Conditional formatting for profit/loss, one rule pair over all months
+    last_row = header_row + len(MONTHLY_FLOW_FORMULAS)
+    trend_range = f'D{header_row + 1}:D{last_row}'
+    ws.conditional_formatting.add(trend_range,
+        CellIsRule(operator='greaterThan', formula=['0'], 
+                   stopIfTrue=True, 
+                   fill=GOOD_FILL))
     
-    # Create chart
-    chart = LineChart()
-    chart.title = "Revenue vs Expense Trend"
-    chart.style = 12
-    chart.y_axis.title = "Amount"
-    chart.x_axis.title = "Month"
-    chart.height = 10
-    chart.width = 20
+    ws.conditional_formatting.add(trend_range,
+        CellIsRule(operator='lessThan', formula=['0'], 
+                   stopIfTrue=True, 
+                   fill=BAD_FILL))
     
-    # Add data
-    data = Reference(ws, min_col=2, min_row=21, max_row=33, max_col=3)
-    cats = Reference(ws, min_col=1, min_row=22, max_row=33)
-    chart.add_data(data, titles_from_data=True)
-    chart.set_categories(cats)
+    # Create chart; one reference covers the Revenue, Expenses and Net Profit series
+    sheet_ref = quote_sheetname(ws.title)
+    data = Reference(range_string=f"{sheet_ref}!$B${header_row}:$D${last_row}")
+    cats = Reference(range_string=f"{sheet_ref}!$A${header_row + 1}:$A${last_row}")
+    chart = make_trend_chart(data, cats, "Revenue vs Expense Trend")
     
     ws.add_chart(chart, "F22")
     
     # Set column widths
-    ws.column_dimensions['A'].width = 18
-    ws.column_dimensions['B'].width = 18
-    ws.column_dimensions['C'].width = 18
-    ws.column_dimensions['D'].width = 18
-    ws.column_dimensions['E'].width = 18
-    ws.column_dimensions['F'].width = 3
+    set_column_widths(ws, [18, 18, 18, 18, 18, 3])
+    
+    return ws
 
 
-def main():
-    """Main function to generate the workbook"""
+# Sheets in workbook order: (name, builder, visibility)
+SHEET_BUILDERS = (
+    ("Settings", create_settings_sheet, 'hidden'),
+    ("Customers", create_customers_sheet, 'visible'),
+    ("Vendors", create_vendors_sheet, 'visible'),
+    ("Invoices", create_invoice_sheet, 'visible'),
+    ("Revenue", create_revenue_sheet, 'visible'),
+    ("Expenses", create_expenses_sheet, 'visible'),
+    ("Inventory", create_inventory_sheet, 'visible'),
+    ("Trade Debtors", create_trade_debtors_sheet, 'visible'),
+    ("Cash Position", create_cash_position_sheet, 'visible'),
+    ("Bank Reconciliation", create_bank_reconciliation_sheet, 'visible'),
+    ("Profit & Loss", create_profit_loss_sheet, 'visible'),
+    ("Balance Sheet", create_balance_sheet_sheet, 'visible'),
+    ("Tax Summary", create_tax_summary_sheet, 'visible'),
+    ("Invoice Template", create_invoice_template_sheet, 'visible'),
+    ("Audit Log", create_audit_log_sheet, 'hidden'),
+    ("Dashboard", create_dashboard_sheet, 'visible'),
+)
+
+CACHE_DIR = ".cache"
+OUTPUT_FILENAME = "Event_Lighting_Bookkeeping.xlsx"
+
+
+def save_workbook(wb, filename, fast_zip=False):
+    """Save the workbook with light (or no) zip compression and cached formula values"""
+    # Write the package uncompressed in memory first so the sheet parts can
+    # be patched on their way into the real archive
+    buffer = io.BytesIO()
+    ExcelWriter(wb, zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED)).save()
+    
+    cached_values = getattr(wb, 'cached_values', {})
+    sheet_values = {
+        f"xl/worksheets/sheet{idx}.xml": cached_values[ws.title]
+        for idx, ws in enumerate(wb.worksheets, start=1)
+        if ws.title in cached_values
+    }
+    
+    # openpyxl always deflates at the default level; level 1 is much quicker
+    # for a few percent larger file, and storing is quicker still
+    if fast_zip:
+        compression, options = zipfile.ZIP_STORED, {}
+    else:
+        compression, options = zipfile.ZIP_DEFLATED, {'compresslevel': 1}
+    
+    # Build the archive beside the target and swap it in only once complete,
+    # so a failure never leaves a truncated workbook at filename
+    tmp_path = f"{filename}.tmp"
+    try:
+        with open(tmp_path, 'wb') as out, zipfile.ZipFile(buffer) as package, \
+                zipfile.ZipFile(out, 'w', compression, allowZip64=True, **options) as archive:
+            for part in package.namelist():
+                data = package.read(part)
+                if part in sheet_values:
+                    data = fill_cached_values(data.decode('utf-8'), sheet_values[part]).encode('utf-8')
+                archive.writestr(part, data)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def workbook_cache_key(now):
+    """Hash every input the generated workbook depends on"""
+    digest = hashlib.sha256()
+    
+    # The branding constants and sheet layouts all live in this script
+    with open(os.path.abspath(__file__), 'rb') as f:
+        digest.update(f.read())
+    
+    if os.path.exists(LOGO_FILENAME):
+        logo_stat = os.stat(LOGO_FILENAME)
+        digest.update(repr((logo_stat.st_mtime, logo_stat.st_size)).encode())
+    
+    # Sample rows (bank reconciliation, invoice template, audit log) embed the
+    # build time. Only the date is hashed, so a rebuild later the same day
+    # reuses the earlier copy and its Audit Log sample timestamps; that
+    # staleness is confined to sample data and accepted for the cache hit
+    digest.update(now.strftime('%Y-%m-%d').encode())
+    
+    return digest.hexdigest()
+
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Generate the bookkeeping workbook")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="rebuild the workbook even if a cached copy matches the current inputs")
+    parser.add_argument('--fast-zip', action='store_true', default=bool(os.environ.get('XLSX_FAST')),
+                        help="store the workbook uncompressed (quicker, larger file) for trial runs;"
+                             " also enabled by setting XLSX_FAST")
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help="print nothing unless something goes wrong")
+    return parser.parse_args()
+
+
+def print_banner():
+    """Print the generator banner with the company and logo details"""
     print("\n" + "="*70)
     print("  PROFESSIONAL BOOKKEEPING SYSTEM GENERATOR")
     print("  QuickBooks Edition with Company Branding")
@@ -1758,22 +1841,20 @@ def main():
     print(f"📧 Contact: {COMPANY_EMAIL} | {COMPANY_PHONE}")
     
     # Check for logo
-    if os.path.exists(LOGO_FILENAME):
+    if load_logo_bytes(LOGO_FILENAME) is not None:
         print(f"✅ Logo found: {LOGO_FILENAME}")
         print(f"   Size: {LOGO_WIDTH}x{LOGO_HEIGHT} pixels")
+    elif os.path.exists(LOGO_FILENAME):
+        print(f"⚠️  Logo could not be read: {LOGO_FILENAME}")
+        print(f"   Supported formats: PNG, JPG, GIF")
     else:
         print(f"⚠️  Logo not found: {LOGO_FILENAME}")
         print(f"   Place your logo file in this folder to include it")
         print(f"   Supported formats: PNG, JPG, GIF")
-    
-    print("\n🔨 Generating workbook...")
-    
-    wb = create_workbook()
-    
-    filename = "Event_Lighting_Bookkeeping.xlsx"
-    wb.save(filename)
-    
-    print(f"✓ Workbook created successfully: {filename}")
+
+
+def print_summary(wb):
+    """Print the features and sheets of a freshly built workbook"""
     print("\n" + "="*60)
     print("PROFESSIONAL FEATURES INCLUDED:")
     print("="*60)
@@ -1809,11 +1890,8 @@ def main():
     print("="*60)
     visible_sheets = []
     hidden_sheets = []
-    for sheet in wb.sheetnames:
-        if wb[sheet].sheet_state == 'hidden':
-            hidden_sheets.append(sheet)
-        else:
-            visible_sheets.append(sheet)
+    for ws in wb.worksheets:
+        (hidden_sheets if ws.sheet_state == 'hidden' else visible_sheets).append(ws.title)
     
     for sheet in visible_sheets:
         print(f"  📄 {sheet}")
@@ -1832,5 +1910,43 @@ def main():
     print("  5. Financial reports update automatically!\n")
 
 
+def main():
+    """Main function to generate the workbook"""
+    args = parse_args()
+    
+    if not args.quiet:
+        print_banner()
+    
+    filename = OUTPUT_FILENAME
+    # One build time for every sheet and the cache key
+    now = datetime.now()
+    
+    # Reuse a previous build when nothing it depends on has changed
+    # Uncompressed trial builds are never cached or restored
+    cache_path = None
+    if not (args.no_cache or args.fast_zip):
+        cache_path = os.path.join(CACHE_DIR, f"{workbook_cache_key(now)}.xlsx")
+        if os.path.exists(cache_path):
+            shutil.copyfile(cache_path, filename)
+            if not args.quiet:
+                print(f"\n✓ Inputs unchanged - workbook restored from cache: {filename}")
+                print("   Run with --no-cache to force a rebuild\n")
+            return
+    
+    if not args.quiet:
+        print("\n🔨 Generating workbook...")
+    
+    wb = create_workbook(now)
+    save_workbook(wb, filename, fast_zip=args.fast_zip)
+    
+    if cache_path is not None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        shutil.copyfile(filename, cache_path)
+    
+    if not args.quiet:
+        print(f"✓ Workbook created successfully: {filename}")
+        print_summary(wb)
+
+
 if __name__ == "__main__":
     main()